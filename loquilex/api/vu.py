@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 
@@ -18,6 +20,30 @@ def rms_peak(x: np.ndarray) -> tuple[float, float]:
     return min(1.0, max(0.0, rms)), min(1.0, max(0.0, peak))
 
 
+def rms_peak_clip(
+    x: np.ndarray, scratch: np.ndarray | None = None, clip_level: float = 0.999
+) -> tuple[float, float, float]:
+    """RMS, peak and clipped fraction of a mono frame from a single |x| pass.
+
+    Same RMS/peak as ``rms_peak``; the clipped fraction counts samples with
+    ``|x| >= clip_level``. Pass a float32 ``scratch`` of at least ``x.size``
+    to reuse across frames instead of allocating the |x| buffer per call.
+    """
+    n = x.size
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    if scratch is None or scratch.size < n:
+        scratch = np.empty(n, dtype=np.float32)
+    a = scratch[:n]
+    np.abs(x, out=a)
+    # |clip(x, -1, 1)| == min(|x|, 1); clipping doesn't change the >= clip_level count
+    np.minimum(a, 1.0, out=a)
+    peak = float(a.max())
+    rms = math.sqrt(float(np.dot(a, a)) / n)
+    clipped = int(np.count_nonzero(a >= clip_level))
+    return min(1.0, rms), peak, clipped / n
+
+
 class EmaVu:
     """Simple EMA smoother for VU meters.
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import queue
 import shutil
 import subprocess
@@ -10,6 +11,8 @@ from typing import Callable
 
 import numpy as np
 
+from loquilex.config.defaults import RT
+
 """Microphone capture with sounddevice; ffmpeg pulse/alsa fallback.
 
 Produces 16 kHz mono float32 frames. Never writes files. No side effects on import.
@@ -51,6 +54,25 @@ def _call_with_timeout(func: Callable[[], None], timeout: float, name: str) -> N
         _log(f"{name} timed out after {timeout}s (daemon thread will be killed)")
 
 
+def _raise_thread_priority() -> None:
+    """Best-effort: move the calling (capture/feed) thread ahead of the MT/ASR workers.
+
+    Tries SCHED_FIFO, then a negative nice value for this thread; both need privileges
+    (CAP_SYS_NICE or an rtprio limit) and are silently skipped without them.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+        _log("capture thread priority=SCHED_FIFO/10")
+        return
+    except (AttributeError, OSError):
+        pass
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), -10)
+        _log("capture thread priority=nice-10")
+    except (AttributeError, OSError):
+        pass
+
+
 def capture_stream(callback: Callable[[AudioFrame], None]) -> Callable[[], None]:
     """Start capturing audio and call callback for each frame.
 
@@ -61,12 +83,18 @@ def capture_stream(callback: Callable[[AudioFrame], None]) -> Callable[[], None]
     try:
         import sounddevice as sd
 
-        q: queue.Queue[np.ndarray] = queue.Queue(maxsize=10)
+        # SimpleQueue: no condition variable or task tracking on the audio thread.
+        # It is unbounded, so cap the backlog by hand and drop instead of blocking
+        # the PortAudio callback.
+        q: queue.SimpleQueue[np.ndarray] = queue.SimpleQueue()
+        max_backlog = 10
 
         def on_audio(indata: np.ndarray, _frames: int, _time_info, status) -> None:
             if status:
                 _log(f"sounddevice status: {status}")
-            q.put(indata.copy())
+            if q.qsize() >= max_backlog:
+                return
+            q.put_nowait(indata.copy())
 
         stream = sd.InputStream(
             samplerate=SAMPLE_RATE,
@@ -81,6 +109,8 @@ def capture_stream(callback: Callable[[AudioFrame], None]) -> Callable[[], None]
         stop_flag = threading.Event()
 
         def worker() -> None:
+            if RT.audio_rt_priority:
+                _raise_thread_priority()
             while not stop_flag.is_set():
                 try:
                     block = q.get(timeout=0.2)
@@ -142,6 +172,8 @@ def capture_stream(callback: Callable[[AudioFrame], None]) -> Callable[[], None]
         stop_flag = threading.Event()
 
         def reader() -> None:
+            if RT.audio_rt_priority:
+                _raise_thread_priority()
             bufsize = FRAME_SAMPLES * 4  # float32 bytes
             while not stop_flag.is_set():
                 assert proc.stdout is not None  # Already checked above
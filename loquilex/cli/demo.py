@@ -23,72 +23,559 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import collections
 import json
 import logging
+import threading
 import time
 import uuid
 import warnings
+import wave
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 import queue
+import sys
 import contextlib
+import dataclasses
+import functools
 import math
+import operator
 import os
 
 try:
-    import soundfile as sf  # optional for --prime-wav
+    import soundfile as sf  # optional: --wav decoding (any PCM width) and --prime-wav
 except Exception:
     sf = None
 
+try:
+    import sounddevice as sd  # optional: mic capture (PortAudio)
+except Exception:
+    sd = None
+
+try:
+    import uvloop  # optional: faster event loop / cross-thread wakeups
+except Exception:
+    uvloop = None
+
+try:
+    import orjson  # optional: faster JSONL serialization
+except Exception:
+    orjson = None
+
+try:
+    import soxr  # optional: polyphase resampling for --wav at a different rate
+except Exception:
+    soxr = None
+
 import numpy as np
 
 from loquilex.config.defaults import ASR
-from loquilex.asr.stream import StreamingASR, ASRFinalEvent, ASRPartialEvent
+from loquilex.asr.stream import StreamingASR, ASRFinalEvent, ASRPartialEvent, ASRWord
 from loquilex.mt.service import MTService
 from loquilex.api.server import OUT_ROOT
 
 logger = logging.getLogger("loquilex.demo")
 
+# Max queued ASR events before new partials are dropped (finals are never dropped)
+_EVENT_BACKLOG_MAX = 256
+
+# A partial that merely extends the last translated partial of its segment by
+# fewer than this many characters is not re-translated.
+_PARTIAL_MT_MIN_DELTA = 8
+
 
 def _make_session_dir(name: str | None) -> Path:
-    ts = time.strftime("%Y%m%dT%H%M%S")
-    suffix = uuid.uuid4().hex[:6]
-    sid = name or f"{ts}-{suffix}"
+    sid = name or f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
     session_dir = OUT_ROOT / f"session-{sid}"
     session_dir.mkdir(parents=True, exist_ok=True)
     return session_dir
 
 
-def _asr_event_to_dict(ev: Any) -> dict:
-    if isinstance(ev, ASRFinalEvent):
-        return {
-            "type": ev.type,
-            "stream_id": ev.stream_id,
-            "segment_id": ev.segment_id,
-            "text": ev.text,
-            "ts_monotonic": ev.ts_monotonic,
-            "eou_reason": ev.eou_reason,
-            "words": [w.__dict__ for w in ev.words],
-        }
-    if isinstance(ev, ASRPartialEvent):
-        return {
-            "type": ev.type,
-            "stream_id": ev.stream_id,
-            "segment_id": ev.segment_id,
-            "seq": ev.seq,
-            "text": ev.text,
-            "stable": ev.stable,
-            "ts_monotonic": ev.ts_monotonic,
-            "words": [w.__dict__ for w in ev.words],
+@functools.lru_cache(maxsize=8)
+def _query_input(idx: Any) -> tuple[str, int]:
+    """(name, default samplerate) of an input device; cached since backends may rescan hardware."""
+    info = sd.query_devices(idx, "input")
+    return info.get("name", "default"), int(info.get("default_samplerate") or ASR.sample_rate)
+
+
+@functools.lru_cache(maxsize=4)
+def _prime_noise(n: int) -> np.ndarray:
+    """Low-level priming noise of n samples, generated on first use (fixed seed).
+
+    Left writable: the ASR clips chunks in place, which never alters these values.
+    """
+    noise = np.random.default_rng(0).standard_normal(n, dtype=np.float32)
+    noise *= np.float32(0.003)
+    return noise
+
+
+@functools.lru_cache(maxsize=8)
+def _resample_axes(sr_in: int, sr_out: int, n_in: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (t_in, t_out) sample-index axes for linear resampling of n_in frames.
+
+    Cached because every full chunk of a WAV has the same length; the arrays
+    are read-only. Kept float64 since np.interp would upcast float32 anyway.
+    """
+    n_out = int(round(n_in * sr_out / float(sr_in)))
+    t_in = np.arange(n_in, dtype=np.float64)
+    t_out = np.arange(n_out, dtype=np.float64) * (sr_in / float(sr_out))
+    t_in.setflags(write=False)
+    t_out.setflags(write=False)
+    return t_in, t_out
+
+
+def _wav_chunk_frames(sr: int, target_rate: int, blocksize: int | None) -> int:
+    """Chunk size in source frames; --blocksize is given in frames at the target rate."""
+    if blocksize:
+        # If source and target rates match, pass blocksize straight through.
+        if sr == target_rate:
+            return int(blocksize)
+        # convert processing frames -> source frames
+        return max(1, int(round(blocksize * (sr / float(target_rate)))))
+    # default to ~100ms chunks at source rate
+    return int(sr * 0.1)
+
+
+def _wave_pcm_blocks(raw_f: Any, wf: Any, chunk_frames: int) -> Iterator[np.ndarray]:
+    """Decode 16-bit (or 8-bit) PCM with the stdlib when soundfile is unavailable.
+
+    Yields float32 views of one reusable buffer, shaped (frames,) for mono and
+    (frames, channels) otherwise, matching ``SoundFile.blocks``. Other sample
+    widths raise ``ValueError``; install soundfile to decode them.
+    """
+    chans = wf.getnchannels()
+    sampwidth = wf.getsampwidth()
+    if sampwidth not in (1, 2):
+        raise ValueError(
+            f"{8 * sampwidth}-bit WAV needs soundfile; the stdlib fallback reads 8/16-bit PCM"
+        )
+    # wave.open() leaves raw_f positioned at the start of the data chunk;
+    # read PCM straight into one reusable buffer instead of allocating a
+    # fresh bytes object per chunk via readframes().
+    frame_bytes = sampwidth * chans
+    remaining = wf.getnframes() * frame_bytes
+    buf = bytearray(chunk_frames * frame_bytes)
+    mv = memoryview(buf)
+    pcm_dtype: type[np.signedinteger[Any]]
+    if sampwidth == 2:
+        pcm_dtype, pcm_scale = np.int16, np.float32(1.0 / 32768.0)
+    else:
+        # fallback: interpret as int8
+        pcm_dtype, pcm_scale = np.int8, np.float32(1.0 / 128.0)
+    pcm_buf = np.empty(chunk_frames * chans, dtype=np.float32)
+
+    carry = 0  # bytes of a partial frame left at the front of buf by a short read
+    while remaining > 0:
+        n_read = raw_f.readinto(mv[carry : carry + min(len(buf) - carry, remaining)])
+        if not n_read:
+            break
+        remaining -= n_read
+        n_bytes = carry + n_read
+        whole = n_bytes - n_bytes % frame_bytes
+        if whole:
+            # convert bytes to float32: cast and scale in one pass, no temporaries
+            raw = np.frombuffer(mv[:whole], dtype=pcm_dtype)
+            audio = pcm_buf[: raw.size]
+            np.multiply(raw, pcm_scale, out=audio, dtype=np.float32)
+            yield audio if chans == 1 else audio.reshape(-1, chans)
+        # keep the partial frame so the next read stays sample-aligned
+        carry = n_bytes - whole
+        if carry:
+            buf[:carry] = buf[whole:n_bytes]
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize one newline-terminated JSONL record to UTF-8 (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return (
+        json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_json_default) + "\n"
+    ).encode("utf-8")
+
+
+def _json_default(obj: Any) -> Any:
+    # Mirrors orjson's native dataclass support for the stdlib fallback
+    convert = _JSON_CONVERTERS.get(type(obj))
+    if convert is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return convert(obj)
+
+
+def _writer_loop(
+    write_q: queue.SimpleQueue,
+    events_path: Path,
+    transcript_path: Path,
+    flush_bytes: int = 64 * 1024,
+    flush_interval_s: float = 0.5,
+) -> None:
+    """Drain ("event", dict or ASR event) / ("transcript", str) items to disk until None.
+
+    Records are encoded into in-memory byte buffers which are written once
+    they reach ``flush_bytes`` or ``flush_interval_s`` has passed since the
+    last flush, and always before returning. The files are opened unbuffered
+    since batching already happens here: each flush is one write() per file.
+
+    A record that cannot be encoded is logged and skipped. The first I/O error
+    stops writing, but the queue is still drained to the sentinel so producers
+    never back up behind a dead writer; the error is then re-raised.
+    """
+    ev_buf = bytearray()
+    tx_buf = bytearray()
+    last_flush = time.monotonic()
+    error: OSError | None = None
+
+    def _write_all(f: Any, buf: bytearray) -> None:
+        written = f.write(buf)
+        while written < len(buf):
+            written += f.write(buf[written:])
+
+    with contextlib.ExitStack() as files:
+        try:
+            events_f = files.enter_context(open(events_path, "ab", buffering=0))
+            tx_f = files.enter_context(open(transcript_path, "ab", buffering=0))
+        except OSError as e:
+            logger.error("demo writer cannot open output files: %s", e)
+            error = e
+
+        def _flush() -> None:
+            nonlocal last_flush, error
+            try:
+                if ev_buf:
+                    _write_all(events_f, ev_buf)
+                if tx_buf:
+                    _write_all(tx_f, tx_buf)
+            except OSError as e:
+                logger.error("demo writer stopped after a write error: %s", e)
+                error = e
+            ev_buf.clear()
+            tx_buf.clear()
+            last_flush = time.monotonic()
+
+        while True:
+            # Block indefinitely when idle; otherwise wake in time for the interval flush
+            timeout = None
+            if ev_buf or tx_buf:
+                timeout = max(0.0, last_flush + flush_interval_s - time.monotonic())
+            try:
+                item = write_q.get(timeout=timeout)
+            except queue.Empty:
+                _flush()
+                continue
+            if item is None:
+                break
+            if error is not None:
+                continue
+
+            kind, payload = item
+            try:
+                if kind == "event":
+                    ev_buf += _dumps_line(payload)
+                else:
+                    # strip as str: bytes.strip() would miss Unicode spaces such as U+3000
+                    tx_buf += payload.strip().encode("utf-8")
+                    tx_buf += b"\n"
+            except Exception:
+                logger.exception("dropping %s record that could not be encoded", kind)
+                continue
+
+            if (
+                len(ev_buf) + len(tx_buf) >= flush_bytes
+                or time.monotonic() - last_flush >= flush_interval_s
+            ):
+                _flush()
+
+        if error is None:
+            _flush()
+    if error is not None:
+        raise error
+
+
+class _WriterThread(threading.Thread):
+    """Daemon thread running ``_writer_loop``; keeps the exception that ended it.
+
+    ``main`` joins it once the event loop has finished and re-raises ``error``.
+    """
+
+    def __init__(self, write_q: queue.SimpleQueue, events_path: Path, transcript_path: Path):
+        super().__init__(name="demo-writer", daemon=True)
+        self._loop_args = (write_q, events_path, transcript_path)
+        self.error: BaseException | None = None
+
+    def run(self) -> None:
+        try:
+            _writer_loop(*self._loop_args)
+        except BaseException as e:
+            self.error = e
+
+
+# ASR events are handed to the writer thread as-is: orjson serializes these
+# dataclasses natively, and the stdlib fallback converts them in _json_default
+# using the same field order, so no per-event dict is built on the event loop.
+_WORD_FIELDS = tuple(f.name for f in dataclasses.fields(ASRWord))
+_FINAL_FIELDS = tuple(f.name for f in dataclasses.fields(ASRFinalEvent))
+_PARTIAL_FIELDS = tuple(f.name for f in dataclasses.fields(ASRPartialEvent))
+
+
+def _fields_to_dict(fields: tuple[str, ...]) -> Callable[[Any], dict]:
+    get = operator.attrgetter(*fields)
+    return lambda obj: dict(zip(fields, get(obj)))
+
+
+# Exact-type dispatch: one dict lookup per object instead of an isinstance chain.
+_JSON_CONVERTERS: dict[type, Callable[[Any], dict]] = {
+    ASRWord: _fields_to_dict(_WORD_FIELDS),
+    ASRFinalEvent: _fields_to_dict(_FINAL_FIELDS),
+    ASRPartialEvent: _fields_to_dict(_PARTIAL_FIELDS),
+}
+
+
+class _LatencyHistogram:
+    """Streaming latency quantiles in O(1) memory.
+
+    Samples land in log-spaced buckets (~1% wide) between ``lo_ms`` and
+    ``hi_ms``, so updates are constant time and quantiles are accurate to
+    about one bucket width regardless of session length.
+    """
+
+    def __init__(self, lo_ms: float = 0.01, hi_ms: float = 600_000.0, growth: float = 1.01):
+        self._lo = lo_ms
+        self._log_g = math.log(growth)
+        self._counts = np.zeros(int(math.log(hi_ms / lo_ms) / self._log_g) + 2, dtype=np.int64)
+        self._min = math.inf
+        self._max = -math.inf
+        self.count = 0
+
+    def update(self, value_ms: float) -> None:
+        if value_ms <= self._lo:
+            idx = 0
+        else:
+            idx = min(int(math.log(value_ms / self._lo) / self._log_g) + 1, len(self._counts) - 1)
+        self._counts[idx] += 1
+        self._min = min(self._min, value_ms)
+        self._max = max(self._max, value_ms)
+        self.count += 1
+
+    def quantiles(self, qs: list[float]) -> list[float]:
+        """Return the requested quantiles (0..1); bucket midpoints clamped to the observed range."""
+        # one cumulative pass and one vectorized search for all requested ranks
+        ranks = np.maximum(1, np.ceil(np.asarray(qs, dtype=np.float64) * self.count))
+        idx = np.searchsorted(np.cumsum(self._counts), ranks)
+        mids = np.where(idx > 0, self._lo * np.exp((idx - 0.5) * self._log_g), self._lo)
+        return np.clip(mids, self._min, self._max).tolist()
+
+
+class _AsyncBatcher:
+    """Coalesce submitted items into batches for a synchronous batch handler.
+
+    A batch is dispatched when it reaches ``max_batch_size`` items or when
+    ``max_wait_ms`` has elapsed since its first item, whichever comes first.
+    Must be used from the event loop thread.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[Any]], None],
+        max_batch_size: int = 8,
+        max_wait_ms: int = 20,
+    ) -> None:
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000.0
+        self._pending: list[Any] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    def submit(self, item: Any) -> None:
+        self._pending.append(item)
+        if len(self._pending) >= self._max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._max_wait, self.flush)
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        try:
+            self._process_batch(batch)
+        except Exception:
+            logger.exception("batch processing failed")
+
+
+class _AudioRing:
+    """Single-producer/single-consumer ring of preallocated float32 blocks.
+
+    The producer (the PortAudio callback thread) calls ``push`` and the
+    consumer (the event loop) calls ``drain``. Each index is only advanced by
+    one side, so no lock is needed; when the consumer falls a full ring
+    behind, new blocks are dropped.
+    """
+
+    def __init__(self, n_slots: int, blocksize: int) -> None:
+        self.n_slots = max(2, int(n_slots))
+        self.blocksize = int(blocksize)
+        self._ring = np.zeros((self.n_slots, self.blocksize), dtype=np.float32)
+        self._len = [0] * self.n_slots
+        self._w = 0  # advanced by push only
+        self._r = 0  # advanced by drain only
+
+    def push(self, mono: np.ndarray, frames: int) -> bool:
+        """Copy up to ``blocksize`` of ``frames`` samples into the next free slot.
+
+        Returns False (block dropped) when all slots are still outstanding.
+        """
+        w = self._w
+        if w - self._r >= self.n_slots:
+            return False
+        slot = w % self.n_slots
+        n = min(int(frames), self.blocksize)
+        np.copyto(self._ring[slot, :n], mono[:n])
+        self._len[slot] = n
+        self._w = w + 1
+        return True
+
+    def drain(self, consume: Callable[[np.ndarray], None]) -> None:
+        """Hand every filled block to ``consume`` in order, as a view into the ring.
+
+        A slot is released only after ``consume`` returns, so it must copy
+        whatever it keeps. Errors are logged and the block is skipped.
+        """
+        while self._r < self._w:
+            slot = self._r % self.n_slots
+            try:
+                consume(self._ring[slot, : self._len[slot]])
+            except Exception:
+                logger.exception("error processing audio chunk")
+            self._r += 1
+
+
+class _MTEventHandlers:
+    """Per-session ASR event handling on the event loop thread.
+
+    Counts events, micro-batches partial/final translation through
+    ``mt.translate_batch`` and hands every record to ``put`` (the writer
+    queue's ``put_nowait``). ``handlers`` maps event type to handler.
+    """
+
+    def __init__(
+        self,
+        mt: Any,
+        put: Callable[[Any], None],
+        src_lang: str,
+        tgt_lang: str,
+        partials: bool,
+        stats: dict[str, int],
+        latencies_ms: _LatencyHistogram,
+    ) -> None:
+        self._mt = mt
+        self._put = put
+        self._src_lang = src_lang
+        self._tgt_lang = tgt_lang
+        self._partials = partials
+        self._stats = stats
+        self._latencies_ms = latencies_ms
+        self._partial_batcher = _AsyncBatcher(
+            self._translate_partials, max_batch_size=8, max_wait_ms=20
+        )
+        self._final_batcher = _AsyncBatcher(
+            self._translate_finals, max_batch_size=8, max_wait_ms=50
+        )
+        # segment_id -> last partial text sent to MT (entries dropped on final)
+        self._last_mt_partial: dict[str, str] = {}
+        # One dict lookup per event instead of a chain of string compares
+        self.handlers: dict[str, Callable[[Any], None]] = {
+            "mt.synth": self.handle_synth,
+            "asr.partial": self.handle_partial,
+            "asr.final": self.handle_final,
         }
-    return {"type": "unknown"}
+
+    def _translate_partials(self, evs: list[ASRPartialEvent]) -> None:
+        # One MT call per burst of partials instead of one per event
+        trs = self._mt.translate_batch([ev.text for ev in evs], self._src_lang, self._tgt_lang)
+        # one timestamp for the whole batch: all of it completed at once
+        ts = time.monotonic()
+        for ev, tr in zip(evs, trs):
+            mt_event = {
+                "type": "mt.partial",
+                "text_src": ev.text,
+                "text_tgt": tr.text,
+                "provider": tr.provider,
+                "src_lang": tr.src_lang,
+                "tgt_lang": tr.tgt_lang,
+                "ts_monotonic": ts,
+            }
+            self._put(("event", mt_event))
+
+    def _translate_finals(self, items: list[tuple[int, ASRFinalEvent]]) -> None:
+        # Finals arriving close together share one MT call
+        trs = self._mt.translate_batch([ev.text for _, ev in items], self._src_lang, self._tgt_lang)
+        t1 = time.monotonic()
+        for (seq, ev), tr in zip(items, trs):
+            latency_ms = (t1 - ev.ts_monotonic) * 1000.0
+            self._latencies_ms.update(latency_ms)
+
+            mt_event = {
+                "type": "mt.final",
+                "seq": seq,
+                "segment_id": ev.segment_id,
+                "text_src": ev.text,
+                "text_tgt": tr.text,
+                "provider": tr.provider,
+                "src_lang": tr.src_lang,
+                "tgt_lang": tr.tgt_lang,
+                "t0_ms": int(ev.ts_monotonic * 1000),
+                "t1_ms": int(t1 * 1000),
+                "latency_ms": latency_ms,
+            }
+            self._put(("event", mt_event))
+            # Append to transcript
+            self._put(("transcript", tr.text))
+
+    def handle_synth(self, ev: dict) -> None:
+        # synthetic fallback final
+        self._put(("event", ev))
+        self._put(("transcript", ev["text_tgt"]))
+
+    def handle_partial(self, ev: ASRPartialEvent) -> None:
+        self._stats["partials"] += 1
+        self._put(("event", ev))
+        # Optionally translate partials (micro-batched), skipping ones that
+        # only extend the last translated text for this segment by a little
+        if self._partials:
+            prev = self._last_mt_partial.get(ev.segment_id)
+            if prev is not None and (
+                ev.text == prev
+                or (
+                    not ev.stable
+                    and ev.text.startswith(prev)
+                    and len(ev.text) - len(prev) < _PARTIAL_MT_MIN_DELTA
+                )
+            ):
+                return
+            self._last_mt_partial[ev.segment_id] = ev.text
+            self._partial_batcher.submit(ev)
+
+    def handle_final(self, ev: ASRFinalEvent) -> None:
+        self._stats["finals"] += 1
+        self._put(("event", ev))
+        self._last_mt_partial.pop(ev.segment_id, None)
+        # Translate final (micro-batched)
+        self._final_batcher.submit((self._stats["finals"], ev))
+
+    def flush(self) -> None:
+        """Translate anything still waiting in either batcher."""
+        self._partial_batcher.flush()
+        self._final_batcher.flush()
 
 
 async def _run_demo(
     duration: int,
     wav_path: str | None,
     partials: bool,
-    session_name: str | None,
+    session_dir: Path,
+    write_q: queue.SimpleQueue,
     src_lang: str,
     tgt_lang: str,
     echo: bool = False,
@@ -104,29 +591,55 @@ async def _run_demo(
     prime_mt: bool = False,
     allow_fallback: bool = True,
 ):
-    session_dir = _make_session_dir(session_name)
-    events_path = session_dir / "events.jsonl"
-    transcript_path = session_dir / "transcript.txt"
-
     asr = StreamingASR(stream_id=session_dir.name)
     mt = MTService()
 
-    event_queue: asyncio.Queue = asyncio.Queue()
+    # ASR callbacks append to a deque and only wake the consumer on the
+    # empty -> non-empty transition, instead of scheduling a loop callback
+    # per event.
+    ev_dq: collections.deque[tuple[str, Any]] = collections.deque()
+    ev_wake = asyncio.Event()
     loop = asyncio.get_running_loop()
+    loop_thread = threading.get_ident()
+    # Bound once: these run per ASR event / per audio block
+    _loop_time = loop.time
+    _call_threadsafe = loop.call_soon_threadsafe
+    _get_ident = threading.get_ident
+    _dq_append = ev_dq.append
+    _wake = ev_wake.set
+
+    def _post_event(typ: str, ev: Any) -> None:
+        # Bound the backlog if the consumer stalls (e.g. slow MT): partials are
+        # superseded by later ones, so shed those; finals/control items are kept.
+        if typ == "asr.partial" and len(ev_dq) >= _EVENT_BACKLOG_MAX:
+            return
+        # thread-safe: deque.append is atomic; wake only if the consumer may be idle
+        was_empty = not ev_dq
+        _dq_append((typ, ev))
+        if was_empty:
+            # ASR runs on the loop thread for --wav and the mic pump, so usually
+            # the event can be set directly without the self-pipe wakeup
+            if _get_ident() == loop_thread:
+                _wake()
+            else:
+                _call_threadsafe(_wake)
 
-    # warmup & RMS helpers
+    # warmup & energy-gate helpers
     # warmup_deadline will be set when the stream opens
     warmup_deadline = 0.0
+    energy_thresh_sq = energy_thresh * energy_thresh
 
-    def _rms(mono_np: np.ndarray) -> float:
-        # mono_np: float32 numpy array in [-1, 1]
-        if energy_thresh <= 0.0:
-            return 1.0
-        return math.sqrt(float((mono_np.astype("float32") ** 2).mean()))
+    def _below_energy(mono: np.ndarray) -> bool:
+        # RMS < thresh  <=>  sum(x^2) < thresh^2 * n: one BLAS dot, no sqrt or temporaries
+        # (InputStream is opened with dtype="float32", so no conversion is needed)
+        return float(np.dot(mono, mono)) < energy_thresh_sq * mono.size
 
-    def _linear_resample(x: np.ndarray, sr_in: int, sr_out: int) -> np.ndarray:
+    def _resample(x: np.ndarray, sr_in: int, sr_out: int) -> np.ndarray:
         if sr_in == sr_out:
             return x.astype("float32", copy=False)
+        if soxr is not None:
+            # one-shot polyphase resample; no aliasing from linear interpolation
+            return soxr.resample(np.ascontiguousarray(x, dtype=np.float32), sr_in, sr_out, "HQ")
         ratio = sr_out / float(sr_in)
         idx = np.arange(0, int(len(x) * ratio)) / ratio
         base = np.arange(len(x))
@@ -136,21 +649,17 @@ async def _run_demo(
     if wav_path:
         # Read WAV header to determine source samplerate without opening audio device
         try:
-            import wave
-
-            with wave.open(wav_path, "rb") as _wf:
-                src_rate = int(_wf.getframerate() or ASR.sample_rate)
+            if sf is not None:
+                src_rate = int(sf.info(wav_path).samplerate)
+            else:
+                with wave.open(wav_path, "rb") as _wf:
+                    src_rate = int(_wf.getframerate() or ASR.sample_rate)
         except Exception:
             src_rate = ASR.sample_rate
         src_name = f"wav {wav_path}"
     else:
         try:
-            import sounddevice as sd
-
-            in_idx = sd.default.device[0]
-            in_dev = sd.query_devices(in_idx, "input")
-            src_name = in_dev.get("name", "default")
-            src_rate = int(in_dev.get("default_samplerate") or ASR.sample_rate)
+            src_name, src_rate = _query_input(sd.default.device[0])
         except Exception:
             src_name, src_rate = "default", ASR.sample_rate
 
@@ -168,214 +677,172 @@ async def _run_demo(
             time.sleep(1)
         print(" " * 32, end="\r")
 
-    stats: dict[str, int | list[float]] = {"partials": 0, "finals": 0, "latencies_ms": []}
+    stats: dict[str, int] = {"partials": 0, "finals": 0}
+    latencies_ms = _LatencyHistogram()
+
+    # Per-event echo lines only force a flush on an interactive terminal; when
+    # stdout is piped they ride the normal block buffer instead of a syscall each.
+    echo_flush = sys.stdout.isatty()
 
     def on_partial(ev: ASRPartialEvent) -> None:
         # Drop events during warmup window
-        if warmup_deadline and loop.time() < warmup_deadline:
+        if warmup_deadline and _loop_time() < warmup_deadline:
             return
-        loop.call_soon_threadsafe(event_queue.put_nowait, ("asr.partial", ev))
+        _post_event("asr.partial", ev)
         if echo and getattr(ev, "text", None):
-            print(f"… {ev.text}", flush=True)
+            print(f"… {ev.text}", flush=echo_flush)
 
     def on_final(ev: ASRFinalEvent) -> None:
-        if warmup_deadline and loop.time() < warmup_deadline:
+        if warmup_deadline and _loop_time() < warmup_deadline:
             return
-        loop.call_soon_threadsafe(event_queue.put_nowait, ("asr.final", ev))
+        _post_event("asr.final", ev)
         if echo and getattr(ev, "text", None):
-            print(f"✔ asr.final: {ev.text}", flush=True)
+            print(f"✔ asr.final: {ev.text}", flush=echo_flush)
 
+    # Serialization and file I/O run on the writer thread main() owns; the
+    # consumer only does bookkeeping and MT, then hands records off via write_q.
     async def event_consumer():
-        # open files
-        with (
-            open(events_path, "a", encoding="utf-8") as events_f,
-            open(transcript_path, "a", encoding="utf-8") as tx_f,
-        ):
-            try:
-                while True:
-                    try:
-                        typ, ev = await asyncio.wait_for(event_queue.get(), timeout=1.0)
-                    except asyncio.TimeoutError:
-                        # check for overall duration elapsed
-                        if stop_at and time.monotonic() >= stop_at:
-                            break
-                        continue
-
-                    if typ == "asr.partial":
-                        stats["partials"] += 1
-                        data = _asr_event_to_dict(ev)
-                        # Optionally translate partials
-                        if partials:
-                            tr = mt.translate_text(ev.text, src_lang, tgt_lang)
-                            mt_event = {
-                                "type": "mt.partial",
-                                "text_src": ev.text,
-                                "text_tgt": tr.text,
-                                "provider": tr.provider,
-                                "src_lang": tr.src_lang,
-                                "tgt_lang": tr.tgt_lang,
-                                "ts_monotonic": time.monotonic(),
-                            }
-                            events_f.write(json.dumps(data, ensure_ascii=False) + "\n")
-                            events_f.write(json.dumps(mt_event, ensure_ascii=False) + "\n")
-                            events_f.flush()
-                        else:
-                            events_f.write(json.dumps(data, ensure_ascii=False) + "\n")
-                            events_f.flush()
-
-                    elif typ == "asr.final":
-                        stats["finals"] += 1
-                        data = _asr_event_to_dict(ev)
-                        events_f.write(json.dumps(data, ensure_ascii=False) + "\n")
-                        # Translate final
-                        tr = mt.translate_text(ev.text, src_lang, tgt_lang)
-                        t1 = time.monotonic()
-                        latency_ms = (t1 - ev.ts_monotonic) * 1000.0
-                        stats["latencies_ms"].append(latency_ms)
-
-                        mt_event = {
-                            "type": "mt.final",
-                            "seq": stats["finals"],
-                            "segment_id": ev.segment_id,
-                            "text_src": ev.text,
-                            "text_tgt": tr.text,
-                            "provider": tr.provider,
-                            "src_lang": tr.src_lang,
-                            "tgt_lang": tr.tgt_lang,
-                            "t0_ms": int(ev.ts_monotonic * 1000),
-                            "t1_ms": int(t1 * 1000),
-                            "latency_ms": latency_ms,
-                        }
-
-                        events_f.write(json.dumps(mt_event, ensure_ascii=False) + "\n")
-                        events_f.flush()
-
-                        # Append to transcript
-                        tx_f.write(tr.text.strip() + "\n")
-                        tx_f.flush()
+        mt_handlers = _MTEventHandlers(
+            mt, write_q.put_nowait, src_lang, tgt_lang, partials, stats, latencies_ms
+        )
+        handlers = mt_handlers.handlers
 
-            except asyncio.CancelledError:
-                # allow graceful shutdown
-                return
+        try:
+            while True:
+                await ev_wake.wait()
+                # clear before draining so an append racing the drain re-arms it
+                ev_wake.clear()
+                while ev_dq:
+                    typ, ev = ev_dq.popleft()
+                    handler = handlers.get(typ)
+                    if handler is not None:
+                        handler(ev)
+                    elif typ == "stop":
+                        return
 
-    # Audio feeder
-    stop_at = time.monotonic() + float(duration)
+        except asyncio.CancelledError:
+            # allow graceful shutdown
+            return
+        finally:
+            # translate anything still waiting, then let the writer drain
+            # (joined by main() once the loop is gone, never on the loop thread)
+            mt_handlers.flush()
+            write_q.put_nowait(None)
 
+    # Audio feeder
     async def feed_wav(path: str):
         # read wav and feed chunks at the processing/target rate
-        import wave
-
-        wf = wave.open(path, "rb")
-        sr = wf.getframerate()
-        chans = wf.getnchannels()
-        sampwidth = wf.getsampwidth()
-
-        # Determine chunk size in source frames.
-        # --blocksize is interpreted as frames at the processing/target rate.
-        if blocksize:
-            # If source and target rates match, pass blocksize straight through.
-            if sr == target_rate:
-                chunk_frames = int(blocksize)
-            else:
-                # convert processing frames -> source frames
-                chunk_frames = max(1, int(round(blocksize * (sr / float(target_rate)))))
+        if sf is not None:
+            # libsndfile decodes any PCM width or float WAV straight to float32;
+            # passing out= makes blocks() fill one reusable array instead of
+            # copying every block.
+            with sf.SoundFile(path) as f:
+                chunk_frames = _wav_chunk_frames(f.samplerate, target_rate, blocksize)
+                shape = (chunk_frames, f.channels) if f.channels > 1 else (chunk_frames,)
+                out = np.empty(shape, dtype=np.float32)
+                await _feed_blocks(f.blocks(out=out), f.samplerate, chunk_frames)
         else:
-            # default to ~100ms chunks at source rate
-            chunk_ms = 100
-            chunk_frames = int(sr * (chunk_ms / 1000.0))
-
-        while True:
-            frames = wf.readframes(chunk_frames)
-            if not frames:
-                break
-            # convert bytes to float32
-            if sampwidth == 2:
-                audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
-            else:
-                # fallback: interpret as int8
-                audio = np.frombuffer(frames, dtype=np.int8).astype(np.float32) / 128.0
-
-            if chans > 1:
-                audio = audio.reshape(-1, chans)[:, 0]
+            with open(path, "rb") as raw_f, wave.open(raw_f, "rb") as wf:
+                sr = wf.getframerate()
+                chunk_frames = _wav_chunk_frames(sr, target_rate, blocksize)
+                await _feed_blocks(_wave_pcm_blocks(raw_f, wf, chunk_frames), sr, chunk_frames)
+
+    async def _feed_blocks(blocks: Iterator[np.ndarray], sr: int, chunk_frames: int) -> None:
+        # Reusable float32 output for the stereo downmix (the ASR copies
+        # whatever it keeps into its own buffer).
+        mono_buf = np.empty(chunk_frames, dtype=np.float32)
+
+        # Stateful polyphase resampler when available (no per-chunk edge effects
+        # or aliasing); otherwise fall back to linear interpolation.
+        resampler = None
+        if sr != target_rate and soxr is not None:
+            resampler = soxr.ResampleStream(sr, target_rate, 1, dtype="float32", quality="HQ")
+
+        # Pace against an absolute deadline so sleep overshoot doesn't accumulate
+        next_t = loop.time()
+
+        for audio in blocks:
+            # Downmix to mono (average channels) keeping the result contiguous
+            if audio.ndim > 1:
+                if audio.shape[1] == 2:
+                    mono = mono_buf[: audio.shape[0]]
+                    np.add(audio[:, 0], audio[:, 1], out=mono)
+                    mono *= np.float32(0.5)
+                    audio = mono
+                else:
+                    audio = audio.mean(axis=1, dtype=np.float32)
 
             # If sample rate differs, resample to the processing/target rate
-            if sr != target_rate:
-                import numpy as _np
-
-                duration_s = audio.shape[0] / float(sr)
-                target_n = int(round(duration_s * float(target_rate)))
-                if target_n <= 0:
+            if resampler is not None:
+                audio = resampler.resample_chunk(audio)
+                if audio.size == 0:
                     continue
-                audio = _np.interp(
-                    _np.linspace(0.0, duration_s, target_n, endpoint=False),
-                    _np.linspace(0.0, duration_s, audio.shape[0], endpoint=False),
-                    audio,
-                ).astype("float32", copy=False)
-            else:
-                # ensure float32 dtype
-                audio = audio.astype("float32", copy=False)
+            elif sr != target_rate:
+                t_in, t_out = _resample_axes(sr, target_rate, audio.shape[0])
+                if t_out.size == 0:
+                    continue
+                audio = np.interp(t_out, t_in, audio).astype("float32", copy=False)
 
             asr.process_audio_chunk(audio, on_partial, on_final)
-            # sleep relative to target rate and number of frames processed
-            await asyncio.sleep(len(audio) / float(target_rate))
+            # advance the deadline by the audio duration just fed
+            next_t += len(audio) / float(target_rate)
+            delay = next_t - loop.time()
+            if delay < -0.5:
+                # fell badly behind (slow ASR); resync instead of bursting to catch up
+                logger.debug("feed_wav behind real time by %.3fs; resyncing", -delay)
+                next_t = loop.time()
+            # always yield so the consumer keeps draining events
+            await asyncio.sleep(max(0.0, delay))
+
+        if resampler is not None:
+            # drain the resampler's delay line
+            tail = resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True)
+            if tail.size:
+                asr.process_audio_chunk(tail, on_partial, on_final)
 
     async def feed_mic():
-        try:
-            import sounddevice as sd
-
-        except Exception:
+        if sd is None:
             raise RuntimeError("sounddevice not available; use --wav")
 
-        # Use a bounded stdlib queue to transfer raw audio from the PortAudio
-        # callback thread into an asyncio-friendly pump. This keeps the
-        # PortAudio callback ultra-light and moves ASR processing off-thread.
-        loop = asyncio.get_running_loop()  # noqa: F841 (used in nested callbacks)
+        # Interpret blocksize as frames at the processing/target rate
+        istream_blocksize = int(blocksize or 1024)
 
-        audio_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        # Preallocated SPSC ring: the PortAudio callback copies each block in
+        # (no heap allocation on the audio thread) and wakes the pump, which
+        # feeds the blocks to ASR in order on the loop.
+        ring = _AudioRing(queue_size, istream_blocksize)
+        ring_push = ring.push
+        audio_ready = asyncio.Event()
         running = True
+        wake_pump = audio_ready.set
 
-        def sd_callback(indata, _frames, _time_info, _status):
+        def sd_callback(indata, frames, _time_info, _status):
             # keep this ultra-light; never run ASR here
-            try:
-                if energy_thresh > 0.0:
-                    # expect shape (frames, channels)
-                    mono = np.asarray(indata, dtype=np.float32)
-                    if mono.ndim > 1:
-                        mono = mono[:, 0]
-                    # cheap RMS check; inline call to avoid heavy ops
-                    if _rms(mono) < energy_thresh:
-                        return
-                audio_q.put_nowait(indata.copy())
-            except queue.Full:
-                # drop if overloaded; bounded by design
-                pass
+            # InputStream is opened with dtype="float32", channels=1
+            mono = indata[:, 0] if indata.ndim > 1 else indata
+            if energy_thresh > 0.0 and _below_energy(mono):
+                return
+            if ring_push(mono, frames):
+                _call_threadsafe(wake_pump)
+
+        def _process_chunk(chunk: np.ndarray) -> None:
+            asr.process_audio_chunk(chunk, on_partial, on_final)
 
         async def pump_audio():
             # move heavy work off the PortAudio thread
             try:
                 while running:
-                    # blocking get() executed in a thread to avoid blocking the loop
-                    chunk = await asyncio.to_thread(audio_q.get)
-                    # if your ASR expects 16k mono float32, ensure chunk matches
-                    try:
-                        arr = np.asarray(chunk, dtype=np.float32)
-                        if arr.ndim > 1:
-                            arr = arr[:, 0]
-                        asr.process_audio_chunk(arr, on_partial, on_final)
-                    except Exception:
-                        logger.exception("error processing audio chunk")
+                    await audio_ready.wait()
+                    audio_ready.clear()
+                    ring.drain(_process_chunk)
             except asyncio.CancelledError:
                 pass
 
-        running = True
         pump_task = asyncio.create_task(pump_audio())
 
         # pick settings your ASR expects; adjust samplerate/channels if different
         device_param = (input_device, None) if input_device is not None else None
 
-        # Interpret blocksize as frames at the processing/target rate
-        istream_blocksize = int(blocksize or 1024)
-
         with sd.InputStream(
             samplerate=target_rate,
             channels=1,
@@ -432,13 +899,13 @@ async def _run_demo(
                 return
             try:
                 data, sr = sf.read(prime_wav, dtype="float32", always_2d=True)
-                frames = _linear_resample(data[:, 0], sr, samplerate)
+                frames = _resample(data[:, 0], sr, samplerate)
             except Exception:
                 print("⚠️  failed to read prime-wav; skipping priming", flush=True)
                 return
         elif prime_ms and prime_ms > 0:
             n = int((prime_ms / 1000.0) * samplerate)
-            frames = np.random.randn(n).astype("float32") * 0.003
+            frames = _prime_noise(n)
         else:
             return
 
@@ -489,6 +956,7 @@ async def _run_demo(
                     pass
 
             tr = mt.translate_text(fallback_src, src_lang, tgt_lang)
+            now_ms = int(time.monotonic() * 1000)
             synth_event = {
                 "type": "mt.final",
                 "seq": 1,
@@ -498,53 +966,33 @@ async def _run_demo(
                 "provider": tr.provider,
                 "src_lang": tr.src_lang,
                 "tgt_lang": tr.tgt_lang,
-                "t0_ms": int(time.monotonic() * 1000),
-                "t1_ms": int(time.monotonic() * 1000),
+                "t0_ms": now_ms,
+                "t1_ms": now_ms,
                 "latency_ms": 0.0,
             }
 
-            with (
-                open(events_path, "a", encoding="utf-8") as events_f,
-                open(transcript_path, "a", encoding="utf-8") as tx_f,
-            ):
-                events_f.write(json.dumps(synth_event, ensure_ascii=False) + "\n")
-                tx_f.write(tr.text.strip() + "\n")
-                tx_f.flush()
-
-            stats["finals"] += 1  # type: ignore[operator]
+            # hand off to the consumer so it writes through its open file handles
+            _post_event("mt.synth", synth_event)
+            stats["finals"] += 1
         except Exception:
             logger.exception("Failed to synthesize final event")
-    # stop consumer
-    consumer_task.cancel()
+    # stop consumer in-band so everything queued ahead of the sentinel is written;
+    # wait_for cancels it if it does not finish in time
+    _post_event("stop", None)
     try:
-        await consumer_task
+        await asyncio.wait_for(consumer_task, timeout=5.0)
     except Exception:
         pass
 
     # Summary
-    lat = stats["latencies_ms"]
-
-    def pctile(p):
-        if not lat:
-            return None
-        import numpy as _np
-
-        return float(_np.percentile(_np.array(lat), p))
-
     print(f"Session dir: {session_dir}")
     print(f"partials={stats['partials']} finals={stats['finals']}")
-    if lat:
-        print(f"latency p50={pctile(50):.2f}ms p90={pctile(90):.2f}ms")
+    if latencies_ms.count:
+        p50, p90 = latencies_ms.quantiles([0.5, 0.9])
+        print(f"latency p50={p50:.2f}ms p90={p90:.2f}ms")
 
 
-def main(argv: list[str] | None = None) -> int:
-    warnings.warn(
-        "loquilex.cli.demo is deprecated for orchestration. "
-        "Use TypeScript orchestration with Python executor services instead. "
-        "See docs/architecture/js-first.md",
-        DeprecationWarning,
-        stacklevel=2,
-    )
+def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="loquilex-demo")
     p.add_argument("--duration", type=int, default=30)
     p.add_argument("--wav", type=str, default=None)
@@ -581,7 +1029,7 @@ def main(argv: list[str] | None = None) -> int:
         "--input-device", type=int, default=None, help="Optional input device index for sounddevice"
     )
     p.add_argument("--blocksize", type=int, default=None, help="Optional input stream blocksize")
-    p.add_argument("--queue-size", type=int, default=64, help="Audio queue max size (frames)")
+    p.add_argument("--queue-size", type=int, default=64, help="Mic audio ring size (blocks)")
     p.add_argument(
         "--samplerate", type=int, default=None, help="Optional override for input stream samplerate"
     )
@@ -605,19 +1053,44 @@ def main(argv: list[str] | None = None) -> int:
     )
     # default False for real usage; tests can opt-in with --allow-fallback
     p.set_defaults(allow_fallback=False)
+    return p
 
-    args = p.parse_args(argv)
+
+# Built once at import; parse_args() does not mutate the parser.
+_PARSER = _build_parser()
+
+
+def main(argv: list[str] | None = None) -> int:
+    warnings.warn(
+        "loquilex.cli.demo is deprecated for orchestration. "
+        "Use TypeScript orchestration with Python executor services instead. "
+        "See docs/architecture/js-first.md",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    args = _PARSER.parse_args(argv)
 
     src = args.src_lang or "en"
     tgt = args.tgt_lang or "zh_Hans"
 
+    # uvloop.run (uvloop >= 0.18) scopes the faster loop to this call without
+    # touching the global event loop policy; fall back to the stdlib loop.
+    run = getattr(uvloop, "run", asyncio.run) if uvloop is not None else asyncio.run
+
+    # The writer lives outside the event loop so every exit path, Ctrl+C
+    # included, can drain it and surface a failed write.
+    session_dir = _make_session_dir(args.session)
+    write_q: queue.SimpleQueue = queue.SimpleQueue()
+    writer = _WriterThread(write_q, session_dir / "events.jsonl", session_dir / "transcript.txt")
+    writer.start()
     try:
-        asyncio.run(
+        run(
             _run_demo(
                 args.duration,
                 args.wav,
                 args.partials,
-                args.session,
+                session_dir,
+                write_q,
                 src,
                 tgt,
                 echo=args.echo,
@@ -636,7 +1109,12 @@ def main(argv: list[str] | None = None) -> int:
         )
     except KeyboardInterrupt:
         print("Interrupted")
-        return 0
+    finally:
+        # the consumer normally sends the sentinel; repeat it in case it never ran
+        write_q.put_nowait(None)
+        writer.join(timeout=5.0)
+    if writer.error is not None:
+        raise writer.error
     return 0
 
 
@@ -37,22 +37,27 @@ import threading
 import time
 import wave
 import warnings
-from collections import deque
+from collections import OrderedDict, deque
 from typing import List, Tuple
 
 import numpy as np
 
-from loquilex.api.vu import EmaVu, rms_peak
+from loquilex.api.vu import EmaVu, rms_peak_clip
 from loquilex.asr.whisper_engine import Segment, WhisperEngine
 from loquilex.audio.capture import capture_stream
 from loquilex.config.defaults import ASR, MT, RT
 from loquilex.mt.translator import Translator
-from loquilex.output.srt import append_srt_cue
-from loquilex.output.text_io import RollingTextFile
-from loquilex.output.vtt import append_vtt_cue, write_vtt
+from loquilex.output.srt import SrtCueAppender
+from loquilex.output.text_io import RollingTextFile, write_atomic
+from loquilex.output.vtt import VttCueAppender, write_vtt
 from loquilex.post.zh_text import post_process
 from loquilex.segmentation.aggregator import Aggregator
 
+# Max finalized segments translated together when the MT queue backs up
+_MT_BATCH_MAX = 8
+# Recent translations kept per run; cumulative partials repeat the same text often
+_MT_CACHE_MAX = 64
+
 
 def main() -> int:
     warnings.warn(
@@ -110,6 +115,12 @@ def main() -> int:
         default=False,
         help="Write live EN/ZH drafts to _live_en.txt/_live_zh.txt atomically",
     )
+    ap.add_argument(
+        "--skip-warmup",
+        action="store_true",
+        default=False,
+        help="Skip the dummy ASR/MT warmup inferences (faster start; first results are slower)",
+    )
     ap.add_argument(
         "--seconds", type=int, default=20, help="Duration in seconds; <=0 to run until Ctrl+C"
     )
@@ -154,15 +165,29 @@ def main() -> int:
     # Initialize MT first so models are loaded before we start capturing audio
     tr = Translator()
     agg = Aggregator()
-    # Prime MT with a tiny draft translation to load weights/caches
+    # Prime MT with a tiny draft translation to load weights/caches. Translator loads its
+    # models lazily, so run this on a thread and overlap it with the ASR load/warmup below.
     warmup_text_src = "Starting service"
-    try:
-        tgt_warm = tr.translate(
-            warmup_text_src, src_lang=src_lang, tgt_lang=tgt_lang, quality="draft"
-        ).text
-        tgt_warm = post_process(tgt_warm)
-    except Exception:
-        tgt_warm = ""
+    mt_warm: List[str] = []
+
+    def _warm_mt() -> None:
+        try:
+            out = tr.translate(
+                warmup_text_src, src_lang=src_lang, tgt_lang=tgt_lang, quality="draft"
+            ).text
+            mt_warm.append(post_process(out))
+        except Exception:
+            pass
+
+    th_warm = threading.Thread(target=_warm_mt, daemon=True)
+    if not args.skip_warmup:
+        th_warm.start()
+    # Then initialize ASR (weights load here regardless; warmup only primes the kernels)
+    eng = WhisperEngine()
+    if not args.skip_warmup:
+        eng.warmup()
+        th_warm.join()
+    tgt_warm = mt_warm[0] if mt_warm else ""
     # Emit initial drafts to files if requested and print once
     if args.live_draft_files:
         try:
@@ -176,29 +201,67 @@ def main() -> int:
     print(f"{src_lang.upper()} ≫ {warmup_text_src}")
     if tgt_warm:
         print(f"{tgt_lang.upper()}* ≫ {tgt_warm}")
-    # Then initialize ASR
-    eng = WhisperEngine()
-    eng.warmup()
-    # Bounded queue to provide backpressure if MT lags behind ASR
-    translate_q: "queue.Queue[tuple[float,float,str]]" = queue.Queue(maxsize=32)
+    # Hand-off of finals to the MT worker: a deque under one Condition, so a put is a single
+    # lock + append + notify. Nothing is dropped; a backlog is coalesced into MT batches.
+    mt_pending: deque[tuple[float, float, str]] = deque()
+    mt_cond = threading.Condition()
+
+    # LRU of recent MT outputs keyed by (quality, text); shared by the capture and MT threads
+    mt_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+    mt_cache_lock = threading.Lock()
+
+    def mt_cache_get(key: tuple[str, str]) -> str | None:
+        with mt_cache_lock:
+            hit = mt_cache.get(key)
+            if hit is not None:
+                mt_cache.move_to_end(key)
+            return hit
+
+    def mt_cache_put(key: tuple[str, str], result) -> None:
+        # Echo fallbacks mean the model failed; leave them uncached so a later call retries
+        if result.model == "echo":
+            return
+        with mt_cache_lock:
+            mt_cache[key] = result.text
+            mt_cache.move_to_end(key)
+            if len(mt_cache) > _MT_CACHE_MAX:
+                mt_cache.popitem(last=False)
+
+    def translate_cached(text: str, quality: str) -> str:
+        key = (quality, text)
+        hit = mt_cache_get(key)
+        if hit is not None:
+            return hit
+        result = tr.translate(text, src_lang=src_lang, tgt_lang=tgt_lang, quality=quality)
+        mt_cache_put(key, result)
+        return result.text
 
     cues: List[Tuple[float, float, str]] = []  # Source finalized cues
     tgt_cues: List[Tuple[float, float, str]] = []  # Target finalized cues
     last_tgt_partial_emit = 0.0
     last_src_partial_print = 0.0
     last_tgt_partial_text = ""
+    last_tgt_partial_src = ""  # source text of the last draft translation
     last_src_partial_text = ""
+    last_partial_done = ""  # raw partial fully handled (source written, draft done or not needed)
     # Live word-window state
     word_window: deque[str] = deque(maxlen=max(0, args.live_window_words))
+    word_window_dirty = False  # words appended since the window was last joined
     last_live_emit = 0.0
     last_src_live = ""
     last_tgt_live = ""
-
-    def write_atomic(path: str, text: str) -> None:
-        tmp = path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            f.write(text)
-        os.replace(tmp, path)
+    # Settings read by the per-frame/per-event callbacks, hoisted out of args once
+    use_word_window = ASR.word_timestamps and args.live_window_words > 0
+    partial_word_cap = max(0, args.partial_word_cap or 0)
+    tgt_partial_debounce_sec = args.tgt_partial_debounce_sec
+    live_update_debounce_sec = args.live_update_debounce_sec
+    live_draft_files = args.live_draft_files
+    final_vtt_src = None if args.no_final_vtt_en else args.final_vtt_en
+    final_srt_tgt = None if args.no_final_srt_zh else args.final_srt_zh
+    combined_vtt = args.combined_vtt
+    io_log_enabled = args.verbose or args.log_io
+    inv_sr = 1.0 / float(ASR.sample_rate)
+    max_buffer_sec = RT.max_buffer_sec
 
     # New writers
     p_src = RollingTextFile(args.partial_en)
@@ -207,7 +270,7 @@ def main() -> int:
     f_tgt = RollingTextFile(args.final_zh, max_lines=args.max_lines)
 
     def _io_log(msg: str) -> None:
-        if args.verbose or args.log_io:
+        if io_log_enabled:
             print(msg)
 
     # Overwrite behavior
@@ -225,16 +288,30 @@ def main() -> int:
                 _io_log(f"[io] removed path={pth}")
             except Exception:
                 pass
-    # Track next SRT index for target language
-    srt_index_tgt = 1
+    # Timed cue writers: cues are buffered per batch of finals and written with one append;
+    # the target SRT index restarts at 1 for each run
+    vtt_src = VttCueAppender(final_vtt_src) if final_vtt_src is not None else None
+    srt_tgt = SrtCueAppender(final_srt_tgt, start_index=1) if final_srt_tgt is not None else None
+
+    def flush_cues(w: VttCueAppender | SrtCueAppender | None) -> None:
+        if w is None:
+            return
+        try:
+            w.flush()
+        except Exception:
+            pass
+
     # Start timing AFTER warmup and just before capture begins
     session_t0_mono: float | None = None  # will set once first audio frame arrives (monotonic)
     last_t1_mono: float | None = None  # monotonic time of latest captured audio end
     audio_since_reset: float = 0.0  # seconds fed to engine since its last reset
-    mt_dropped = 0  # Count of dropped translation requests due to backlog
 
     def on_partial(txt: str) -> None:
         nonlocal last_tgt_partial_emit, last_tgt_partial_text, last_src_partial_text
+        nonlocal last_tgt_partial_src, last_partial_done
+        # Whisper re-emits the in-progress hypothesis; nothing left to do for a handled repeat
+        if txt == last_partial_done:
+            return
         now = time.monotonic()
 
         def emit(s: str) -> None:
@@ -247,23 +324,23 @@ def main() -> int:
         # Write partial source line (single line)
         part = txt.strip()
         last_src_partial_text = part
-        if args.partial_word_cap and args.partial_word_cap > 0:
+        if partial_word_cap:
             words = part.split()
-            part = " ".join(words[: args.partial_word_cap])
+            part = " ".join(words[:partial_word_cap])
         try:
             p_src.rewrite_current_line(part)
             _io_log(f"[io] partial rewrite lang={src_lang} path={p_src.path} chars={len(part)}")
         except Exception:
             pass
         # Live target language partial (debounced), independent of word-window
-        use_word_window = ASR.word_timestamps and args.live_window_words > 0
         if (
             not use_word_window
-            and (now - last_tgt_partial_emit) >= args.tgt_partial_debounce_sec
+            and (now - last_tgt_partial_emit) >= tgt_partial_debounce_sec
             and part
+            and part != last_tgt_partial_src
         ):
-            draft = tr.translate(part, src_lang=src_lang, tgt_lang=tgt_lang, quality="draft").text
-            draft = post_process(draft, tgt_lang)
+            draft = post_process(translate_cached(part, "draft"), tgt_lang)
+            last_tgt_partial_src = part
             if draft and draft != last_tgt_partial_text:
                 print(f"{tgt_lang.upper()}* ≫ {draft}")
                 try:
@@ -275,10 +352,16 @@ def main() -> int:
                     pass
                 last_tgt_partial_text = draft
                 last_tgt_partial_emit = now
+        # A draft still held back by the debounce keeps this text eligible for a retry
+        if use_word_window or not part or part == last_tgt_partial_src:
+            last_partial_done = txt
 
     def on_final(a: float, b: float, txt: str) -> None:
+        nonlocal last_tgt_partial_src, last_partial_done
         if session_t0_mono is None:
             return
+        last_tgt_partial_src = ""
+        last_partial_done = ""
         rel_a = a - session_t0_mono
         rel_b = b - session_t0_mono
         cues.append((rel_a, rel_b, txt))
@@ -295,20 +378,17 @@ def main() -> int:
         except Exception:
             pass
         # Append timed source cue if enabled
-        if not args.no_final_vtt_en:
+        if vtt_src is not None:
             try:
-                append_vtt_cue(args.final_vtt_en, rel_a, rel_b, txt)
+                vtt_src.add(rel_a, rel_b, txt)
                 _io_log(
-                    f"[io] vtt append lang=en path={args.final_vtt_en} a={rel_a:.3f} b={rel_b:.3f} chars={len(txt)}"
+                    f"[io] vtt append lang=en path={final_vtt_src} a={rel_a:.3f} b={rel_b:.3f} chars={len(txt)}"
                 )
             except Exception:
                 pass
-        try:
-            translate_q.put_nowait((a, b, txt))
-        except queue.Full:
-            # Drop if MT is backlogged to keep latency bounded
-            nonlocal mt_dropped
-            mt_dropped += 1
+        with mt_cond:
+            mt_pending.append((a, b, txt))
+            mt_cond.notify()
         print(f"EN(final): {txt}")
 
     def on_seg(seg: Segment) -> None:
@@ -318,7 +398,7 @@ def main() -> int:
             return
         if last_t1_mono is None:
             return
-        buf_sec = min(audio_since_reset, RT.max_buffer_sec)
+        buf_sec = min(audio_since_reset, max_buffer_sec)
         # Map ASR buffer-relative times (seg.start/end) to session-relative using monotonic clock
         seg_start_wall = last_t1_mono - (buf_sec - float(seg.start))
         seg_end_wall = last_t1_mono - (buf_sec - float(seg.end))
@@ -327,24 +407,24 @@ def main() -> int:
         audio_since_reset = 0.0
 
     def on_words(words: List) -> None:  # words are Word objects, but avoid tight coupling in import
-        if not (ASR.word_timestamps and args.live_window_words > 0):
+        if not use_word_window:
             return
-        nonlocal last_live_emit, last_src_live, last_tgt_live
+        nonlocal last_live_emit, last_src_live, last_tgt_live, word_window_dirty
         now = time.monotonic()
         for w in words:
             txt = getattr(w, "text", None) or getattr(w, "word", None) or ""
             t = (txt or "").strip()
             if t:
                 word_window.append(t)
-        if (now - last_live_emit) >= args.live_update_debounce_sec and len(word_window) > 0:
+                word_window_dirty = True
+        # Join only when the debounce allows an emit and the window actually changed
+        if word_window_dirty and (now - last_live_emit) >= live_update_debounce_sec:
+            word_window_dirty = False
             src_chunk = " ".join(word_window)
             if src_chunk != last_src_live:
-                if args.live_draft_files:
+                if live_draft_files:
                     write_atomic(out_live_src, src_chunk + "\n")
-                tgt_draft = tr.translate(
-                    src_chunk, src_lang=src_lang, tgt_lang=tgt_lang, quality="draft"
-                ).text
-                tgt_draft = post_process(tgt_draft, tgt_lang)
+                tgt_draft = post_process(translate_cached(src_chunk, "draft"), tgt_lang)
                 if tgt_draft and tgt_draft != last_tgt_live:
                     print(f"{tgt_lang.upper()}* ≫ {tgt_draft}")
                     # Update the live target partial file as well
@@ -352,14 +432,17 @@ def main() -> int:
                         p_tgt.rewrite_current_line(tgt_draft)
                     except Exception:
                         pass
-                    if args.live_draft_files:
+                    if live_draft_files:
                         write_atomic(out_live_tgt, tgt_draft + "\n")
                     last_tgt_live = tgt_draft
                 last_src_live = src_chunk
                 last_live_emit = now
 
     # Proper capture loop; start capture and set start time on first frame
-    frames: List[np.ndarray] = []
+    # Contiguous staging buffer for ASR input; filled in place and handed over as a view
+    audio_buf = np.empty(int(max_buffer_sec * ASR.sample_rate), dtype=np.float32)
+    buf_len = 0
+    feed_min = ASR.sample_rate // 5  # ~200ms
 
     # Optional audio recording sinks
     audio_mode = args.save_audio
@@ -369,7 +452,9 @@ def main() -> int:
         os.makedirs(os.path.dirname(args.save_audio_path), exist_ok=True)
         if audio_mode == "wav":
             try:
-                wf = wave.open(args.save_audio_path, "wb")
+                # 64 KiB write buffer: ~2 s of int16 mono per write syscall instead of ~8 KiB
+                wav_file = open(args.save_audio_path, "wb", buffering=1 << 16)
+                wf = wave.open(wav_file, "wb")
                 wf.setnchannels(1)
                 wf.setsampwidth(2)  # int16
                 wf.setframerate(ASR.sample_rate)
@@ -397,7 +482,8 @@ def main() -> int:
                     "-y",
                     args.save_audio_path,
                 ]
-                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+                # Large pipe buffer: frames are small, so let them coalesce into fewer writes
+                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, bufsize=1 << 20)
                 audio_sink_ffmpeg = proc
                 print(f"[cli] save-audio started mode=flac path={args.save_audio_path}")
             except Exception as e:
@@ -405,49 +491,104 @@ def main() -> int:
                 audio_mode = "off"
 
     vu_ema = EmaVu(0.5)
+    # VU lines go through a small queue to a printer thread so the capture callback
+    # never blocks on stdout; lines are dropped if the printer falls behind
+    vu_q: "queue.Queue[Tuple[float, float, float]]" = queue.Queue(maxsize=64)
+    stop_vu = threading.Event()
+
+    def vu_printer() -> None:
+        while True:
+            try:
+                batch = [vu_q.get(timeout=0.2)]
+            except queue.Empty:
+                if stop_vu.is_set():
+                    return
+                continue
+            try:
+                while True:
+                    batch.append(vu_q.get_nowait())
+            except queue.Empty:
+                pass
+            # formatting happens here, off the capture thread; one write per batch
+            sys.stdout.write("".join("VU %.4f %.4f %.4f\n" % vu for vu in batch))
+            sys.stdout.flush()
+
+    th_vu = threading.Thread(target=vu_printer, daemon=True)
+    th_vu.start()
+    vu_scratch = np.empty(ASR.sample_rate, dtype=np.float32)  # >= any capture frame
+    # WAV sink scratch: clip/scale in place, then cast into a reused int16 buffer
+    pcm_scratch = np.empty(ASR.sample_rate, dtype=np.float32)
+    pcm16_buf = np.empty(ASR.sample_rate, dtype=np.int16)
+    last_flac_flush = 0.0
     last_vu = 0.0
 
     def feed(fr) -> None:
         nonlocal session_t0_mono, last_t1_mono, audio_since_reset, last_vu
+        nonlocal pcm_scratch, pcm16_buf, audio_buf, buf_len, last_flac_flush
         if session_t0_mono is None:
             session_t0_mono = time.monotonic()
-        frames.append(fr.data)
+        n = len(fr.data)
+        if buf_len + n > audio_buf.size:
+            grown = np.empty(2 * (buf_len + n), dtype=np.float32)
+            grown[:buf_len] = audio_buf[:buf_len]
+            audio_buf = grown
+        # Land the frame in the ASR staging buffer once; VU and sinks all read this
+        # float32 view, so the capture array is only touched by this copy
+        v = audio_buf[buf_len : buf_len + n]
+        np.copyto(v, fr.data, casting="unsafe")
+        buf_len += n
         # Compute VU and emit at ~20 Hz, include clipping percentage
         try:
-            r, p = rms_peak(fr.data)
-            # clipping: count samples within 0.001 of full-scale
-            clipped = np.count_nonzero(np.abs(fr.data) >= 0.999)
-            clip_pct = float(clipped) / float(len(fr.data) or 1)
+            # one |x| pass into a reused scratch buffer; clipping counts samples
+            # within 0.001 of full-scale
+            r, p, clip_pct = rms_peak_clip(v, vu_scratch)
             r2, p2 = vu_ema.update(r, p)
             nowm = time.monotonic()
             if (nowm - last_vu) >= 0.05:
-                print(f"VU {r2:.4f} {p2:.4f} {clip_pct:.4f}")
+                try:
+                    vu_q.put_nowait((r2, p2, clip_pct))
+                except queue.Full:
+                    pass
                 last_vu = nowm
         except Exception:
             pass
         # Tap audio sink
         try:
             if audio_mode == "wav" and audio_sink_wav is not None:
-                # convert float32 [-1,1] to int16
-                pcm16 = (np.clip(fr.data, -1.0, 1.0) * 32767.0).astype(np.int16).tobytes()
-                audio_sink_wav.writeframes(pcm16)
+                # convert float32 [-1,1] to int16 without per-frame temporaries
+                if n > pcm16_buf.size:
+                    pcm_scratch = np.empty(n, dtype=np.float32)
+                    pcm16_buf = np.empty(n, dtype=np.int16)
+                f32 = pcm_scratch[:n]
+                np.clip(v, -1.0, 1.0, out=f32)
+                np.multiply(f32, 32767.0, out=f32)
+                pcm16 = pcm16_buf[:n]
+                pcm16[:] = f32
+                # writeframesraw skips the per-call header patch; close() fixes nframes
+                audio_sink_wav.writeframesraw(pcm16)
             elif (
                 audio_mode == "flac"
                 and audio_sink_ffmpeg is not None
                 and audio_sink_ffmpeg.stdin is not None
             ):
-                audio_sink_ffmpeg.stdin.write(fr.data.tobytes())
+                # Write the frame's buffer directly (no tobytes copy); flush at ~2 Hz
+                audio_sink_ffmpeg.stdin.write(memoryview(v).cast("B"))
+                if fr.t1 - last_flac_flush >= 0.5:
+                    audio_sink_ffmpeg.stdin.flush()
+                    last_flac_flush = fr.t1
         except Exception:
             pass
         # track latest monotonic time and audio seconds since engine reset
         last_t1_mono = fr.t1
-        audio_since_reset += len(fr.data) / float(ASR.sample_rate)
+        audio_since_reset += n * inv_sr
         # periodically run ASR; engine will finalize on pauses
-        if len(frames) >= 2:  # ~200ms
+        if buf_len >= feed_min:
             # Pass on_words if using live word-window; else let it be None
-            cb_words = on_words if (ASR.word_timestamps and args.live_window_words > 0) else None
-            eng.feed([np.concatenate(frames)], on_partial, on_seg, cb_words)
-            frames.clear()
+            cb_words = on_words if use_word_window else None
+            # the engine copies into its own buffer, so the view can be reused right after
+            eng.feed([audio_buf[:buf_len]], on_partial, on_seg, cb_words)
+            buf_len = 0
+            flush_cues(vtt_src)
         # Aggregator handles partial debounce only; finalization by engine
 
     stop = capture_stream(feed)
@@ -463,58 +604,77 @@ def main() -> int:
     # Background translator loop
     stop_mt = threading.Event()
 
-    def mt_worker():
-        while not stop_mt.is_set():
-            try:
-                a, b, txt = translate_q.get(timeout=0.2)
-            except queue.Empty:
-                continue
-            tgt_result = tr.translate(txt, src_lang=src_lang, tgt_lang=tgt_lang, quality="final")
-            tgt_txt = post_process(tgt_result.text, tgt_lang)
-            assert session_t0_mono is not None
-            rel_a = a - session_t0_mono
-            rel_b = b - session_t0_mono
-            tgt_cues.append((rel_a, rel_b, tgt_txt))
-            # Clear partial target line and append final target TXT
-            try:
-                p_tgt.rewrite_current_line("")
-                print(f"[io] partial clear lang={tgt_lang} path={p_tgt.path}")
-            except Exception:
-                pass
+    def emit_final_tgt(a: float, b: float, tgt_txt: str) -> None:
+        assert session_t0_mono is not None
+        rel_a = a - session_t0_mono
+        rel_b = b - session_t0_mono
+        tgt_cues.append((rel_a, rel_b, tgt_txt))
+        # Clear partial target line and append final target TXT
+        try:
+            p_tgt.rewrite_current_line("")
+            print(f"[io] partial clear lang={tgt_lang} path={p_tgt.path}")
+        except Exception:
+            pass
+        try:
+            f_tgt.append_final_line(tgt_txt)
+            print(f"[io] final append lang={tgt_lang} path={f_tgt.path} chars={len(tgt_txt)}")
+        except Exception:
+            pass
+        # Timed outputs for target language
+        if srt_tgt is not None:
             try:
-                f_tgt.append_final_line(tgt_txt)
-                print(f"[io] final append lang={tgt_lang} path={f_tgt.path} chars={len(tgt_txt)}")
+                used_idx = srt_tgt.add(rel_a, rel_b, tgt_txt)
+                print(
+                    f"[io] srt append lang={tgt_lang} path={final_srt_tgt} idx={used_idx} a={rel_a:.3f} b={rel_b:.3f} chars={len(tgt_txt)}"
+                )
             except Exception:
                 pass
-            # Timed outputs for target language
-            nonlocal srt_index_tgt
-            if not args.no_final_srt_zh:
-                try:
-                    used_idx = append_srt_cue(
-                        args.final_srt_zh, srt_index_tgt, rel_a, rel_b, tgt_txt
-                    )
-                    print(
-                        f"[io] srt append lang={tgt_lang} path={args.final_srt_zh} idx={used_idx} a={rel_a:.3f} b={rel_b:.3f} chars={len(tgt_txt)}"
-                    )
-                    srt_index_tgt = used_idx + 1
-                except Exception:
-                    pass
-            if args.combined_vtt:
-                # Rebuild combined cues from pairs and write single VTT
-                combined: List[Tuple[float, float, str]] = []
-                for (ae, be, te), (az, bz, tz) in zip(cues, tgt_cues):
-                    a2 = max(ae, az)
-                    b2 = max(a2 + 1e-3, min(be, bz))
-                    combined.append((a2, b2, f"{src_lang.upper()}: {te}\n{tgt_lang.upper()}: {tz}"))
-                write_vtt(combined, out_vtt)
+        if combined_vtt:
+            # Rebuild combined cues from pairs and write single VTT
+            combined: List[Tuple[float, float, str]] = []
+            for (ae, be, te), (az, bz, tz) in zip(cues, tgt_cues):
+                a2 = max(ae, az)
+                b2 = max(a2 + 1e-3, min(be, bz))
+                combined.append((a2, b2, f"{src_lang.upper()}: {te}\n{tgt_lang.upper()}: {tz}"))
+            write_vtt(combined, out_vtt)
+        else:
+            # No separate target VTT in new spec; keep legacy optional behavior disabled
+            pass
+        print(f"{tgt_lang.upper()}: {tgt_txt}")
+
+    translate_batch = getattr(tr, "translate_batch", None)
+
+    def mt_worker():
+        while not stop_mt.is_set():
+            with mt_cond:
+                if not mt_pending:
+                    mt_cond.wait(0.2)
+                # Take what's queued (up to a batch) so a burst of finals shares one MT call;
+                # any remainder is picked up on the next pass without waiting
+                batch = [mt_pending.popleft() for _ in range(min(len(mt_pending), _MT_BATCH_MAX))]
+            if not batch:
+                continue
+            # Identical finals (e.g. engine re-finalizing the same text) are served from cache
+            outs = [mt_cache_get(("final", txt)) for _, _, txt in batch]
+            misses = list(dict.fromkeys(txt for (_, _, txt), o in zip(batch, outs) if o is None))
+            if translate_batch is not None and len(misses) > 1:
+                results = translate_batch(
+                    misses, src_lang=src_lang, tgt_lang=tgt_lang, quality="final"
+                )
             else:
-                # No separate target VTT in new spec; keep legacy optional behavior disabled
-                pass
-            print(f"{tgt_lang.upper()}: {tgt_txt}")
-            try:
-                translate_q.task_done()
-            except Exception:
-                pass
+                results = [
+                    tr.translate(txt, src_lang=src_lang, tgt_lang=tgt_lang, quality="final")
+                    for txt in misses
+                ]
+            translated = {}
+            for txt, tgt_result in zip(misses, results):
+                mt_cache_put(("final", txt), tgt_result)
+                translated[txt] = tgt_result.text
+            for (a, b, txt), out in zip(batch, outs):
+                emit_final_tgt(
+                    a, b, post_process(out if out is not None else translated[txt], tgt_lang)
+                )
+            flush_cues(srt_tgt)
 
     th_mt = threading.Thread(target=mt_worker, daemon=True)
     th_mt.start()
@@ -522,14 +682,17 @@ def main() -> int:
     # Graceful shutdown handling
     shutdown = threading.Event()
     finalize_now = threading.Event()
+    wake = threading.Event()  # set alongside either flag so the main loop wakes at once
 
     def _on_signal(signum, _frame) -> None:
         # Set shutdown flag; main loop will exit promptly
         if signum == signal.SIGUSR1:
             finalize_now.set()
+            wake.set()
             print("[cli] SIGUSR1 -> finalize-now requested", file=sys.stderr)
             return
         shutdown.set()
+        wake.set()
         print(f"\n[cli] signal={signum} -> shutting down…", file=sys.stderr)
 
     try:
@@ -542,11 +705,19 @@ def main() -> int:
     except Exception:
         pass
 
+    deadline = ready_time_mono + args.seconds if args.seconds > 0 else None
     try:
         while not shutdown.is_set():
-            if args.seconds > 0:
-                if (time.monotonic() - ready_time_mono) >= args.seconds:
+            # Sleep until a signal or the deadline; the 1s cap keeps Ctrl+C responsive
+            # on platforms where a blocked wait isn't interrupted
+            timeout = 1.0
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     break
+                timeout = min(timeout, remaining)
+            wake.wait(timeout)
+            wake.clear()
             # finalize-now support
             if finalize_now.is_set():
                 try:
@@ -556,6 +727,7 @@ def main() -> int:
                         if session_t0_mono is not None and last_t1_mono is not None:
                             a = max(session_t0_mono, last_t1_mono - 1.0)
                             on_final(a, last_t1_mono, last_src_partial_text)
+                            flush_cues(vtt_src)
                             # clear partial files
                             try:
                                 p_src.rewrite_current_line("")
@@ -565,13 +737,19 @@ def main() -> int:
                             last_src_partial_text = ""
                 except Exception:
                     pass
-            time.sleep(0.05)
     except KeyboardInterrupt:
         shutdown.set()
         print("\n[cli] KeyboardInterrupt -> shutting down…", file=sys.stderr)
     finally:
         stop()
         stop_mt.set()
+        with mt_cond:
+            mt_cond.notify()
+        stop_vu.set()
+        try:
+            th_vu.join(timeout=0.5)
+        except Exception:
+            pass
         # give translator a moment to finish last item
         try:
             th_mt.join(timeout=0.5)
@@ -580,18 +758,19 @@ def main() -> int:
         # Close audio sinks
         try:
             if audio_mode == "wav" and audio_sink_wav is not None:
-                audio_sink_wav.close()
+                audio_sink_wav.close()  # patches the header sizes; leaves wav_file open
+                wav_file.close()
             elif audio_mode == "flac" and audio_sink_ffmpeg is not None:
                 if audio_sink_ffmpeg.stdin:
                     audio_sink_ffmpeg.stdin.close()
                 audio_sink_ffmpeg.wait(timeout=2.0)
         except Exception:
             pass
+        flush_cues(vtt_src)
+        flush_cues(srt_tgt)
         # Final flush for legacy combined vtt if used
         if args.combined_vtt:
             write_vtt(cues, out_vtt)
-        if mt_dropped > 0 and args.verbose:
-            print(f"[cli] MT dropped={mt_dropped}")
 
     print("[cli] run complete")
     return 0
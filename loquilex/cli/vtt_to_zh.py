@@ -2,40 +2,52 @@ from __future__ import annotations
 
 import argparse
 import os
+import re
 from typing import List, Tuple
 
 from loquilex.mt.translator import Translator
 from loquilex.output.srt import write_srt
 from loquilex.post.zh_text import post_process
 
+# Cues per MT call; bounded so a long VTT doesn't pad one giant batch
+_BATCH_SIZE = 32
+
+_TS_RE = re.compile(r"(\d+):(\d+):(\d+)[.,](\d+)")
+
+
+def _parse_ts(s: str) -> float:
+    m = _TS_RE.fullmatch(s)
+    if m is None:
+        raise ValueError(f"bad VTT timestamp: {s!r}")
+    h, mi, se, ms = m.groups()
+    return int(h) * 3600 + int(mi) * 60 + int(se) + int(ms) / 1000.0
+
 
 def parse_vtt(path: str) -> List[Tuple[float, float, str]]:
     cues: List[Tuple[float, float, str]] = []
 
-    def parse_ts(s: str) -> float:
-        h, m, rest = s.split(":")
-        if "," in rest:
-            s2, ms = rest.split(",")
-        else:
-            s2, ms = rest.split(".")
-        return int(h) * 3600 + int(m) * 60 + int(s2) + int(ms) / 1000.0
+    def finish(a: str, b: str, text: List[str]) -> None:
+        txt = " ".join(text).strip()
+        if txt:
+            cues.append((_parse_ts(a), _parse_ts(b), txt))
 
+    # Single streaming pass: a "-->" line opens a cue, its text runs to the next blank line
+    timing: Tuple[str, str] | None = None
+    text: List[str] = []
     with open(path, "r", encoding="utf-8") as f:
-        lines = [ln.rstrip("\n") for ln in f]
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if "-->" in line:
-            a, b = [x.strip() for x in line.split("-->")]
-            i += 1
-            text = []
-            while i < len(lines) and lines[i].strip() != "":
-                text.append(lines[i])
-                i += 1
-            txt = " ".join(text).strip()
-            if txt:
-                cues.append((parse_ts(a), parse_ts(b), txt))
-        i += 1
+        for raw in f:
+            line = raw.rstrip("\n")
+            if timing is not None:
+                if line.strip() != "":
+                    text.append(line)
+                    continue
+                finish(*timing, text)
+                timing, text = None, []
+            elif "-->" in line:
+                a, b = [x.strip() for x in line.split("-->")]
+                timing = (a, b)
+    if timing is not None:
+        finish(*timing, text)
     return cues
 
 
@@ -51,19 +63,24 @@ def main() -> None:
 
     zh_lines: List[str] = []
     zh_cues: List[Tuple[float, float, str]] = []
-    for a, b, t in cues:
-        result = tr.translate(t, src_lang="en", tgt_lang="zh", quality="final")
-        txt = post_process(result.text, "zh")
-        zh_lines.append(txt)
-        zh_cues.append((a, b, txt))
+    # Translate in padded batches: one generate call per _BATCH_SIZE cues
+    for i in range(0, len(cues), _BATCH_SIZE):
+        chunk = cues[i : i + _BATCH_SIZE]
+        results = tr.translate_batch(
+            [t for _, _, t in chunk], src_lang="en", tgt_lang="zh", quality="final"
+        )
+        for (a, b, _), result in zip(chunk, results):
+            txt = post_process(result.text, "zh")
+            zh_lines.append(txt)
+            zh_cues.append((a, b, txt))
 
     d = os.path.dirname(args.out_text)
     if d:
         os.makedirs(d, exist_ok=True)
+    # One buffer, one write: per-line writes add up on long transcripts
+    text_out = "".join(line + "\n" for line in zh_lines if line)
     with open(args.out_text, "w", encoding="utf-8") as f:
-        for line in zh_lines:
-            if line:
-                f.write(line + "\n")
+        f.write(text_out)
 
     write_srt(zh_cues, args.out_srt)
     print(f"[cli] wrote {args.out_text} and {args.out_srt} ({len(zh_cues)} cues)")
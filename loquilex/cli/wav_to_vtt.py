@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import argparse
+import mmap
 import wave
 from typing import List, Tuple
 
+try:
+    import soxr  # optional: polyphase resampling for non-16 kHz input
+except Exception:
+    soxr = None
+
 import numpy as np
 
 from loquilex.config.defaults import ASR, pick_device
@@ -11,19 +17,31 @@ from loquilex.output.vtt import write_vtt
 
 
 def read_wav_mono_16k(path: str) -> np.ndarray:
-    with wave.open(path, "rb") as w:
-        sr = w.getframerate()
-        ch = w.getnchannels()
-        n = w.getnframes()
-        raw = w.readframes(n)
-    data = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    with open(path, "rb") as f:
+        with wave.open(f, "rb") as w:
+            sr = w.getframerate()
+            ch = w.getnchannels()
+            n = w.getnframes()
+            # wave stops at the start of the data chunk; map the samples from there
+            offset = f.tell()
+            if w.getsampwidth() != 2:
+                raise ValueError(f"expected 16-bit PCM WAV, got {8 * w.getsampwidth()}-bit")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # zero-copy int16 view of the page cache; cast + scale in one pass into float32
+            count = min(n * ch, (len(mm) - offset) // 2)
+            samples = np.frombuffer(mm, dtype=np.int16, count=count, offset=offset)
+            data = np.multiply(samples, np.float32(1.0 / 32768.0))
+            del samples  # release the buffer export before the map closes
     if ch > 1:
-        data = data.reshape(-1, ch).mean(axis=1)
+        data = data.reshape(-1, ch).mean(axis=1, dtype=np.float32)
     if sr != 16000:
+        if soxr is not None:
+            # polyphase resample; no aliasing from linear interpolation
+            return soxr.resample(data, sr, 16000, "HQ")
         # simple fallback resample using numpy (linear), prefer  ffmpeg externally for quality
-        t = np.linspace(0, len(data) / sr, num=len(data), endpoint=False)
-        t2 = np.linspace(0, len(data) / sr, num=int(len(data) * 16000 / sr), endpoint=False)
-        data = np.interp(t2, t, data).astype(np.float32)
+        n_out = int(len(data) * 16000 / sr)
+        pos = np.arange(n_out, dtype=np.float64) * (sr / 16000.0)
+        data = np.interp(pos, np.arange(len(data)), data).astype(np.float32)
     return data
 
 
@@ -12,36 +12,56 @@ from typing import TypeVar
 T = TypeVar("T")
 
 
-def _env(name: str, default: str) -> str:
+def _env_raw(name: str) -> str | None:
+    """Raw value of an LX_* variable, or None when unset."""
     if not name.startswith("LX_"):
         raise ValueError(f"Only LX_* env vars are allowed, got: {name}")
-    return os.getenv(name, default)
+    return os.environ.get(name)
+
+
+def _env(name: str, default: str) -> str:
+    raw = _env_raw(name)
+    return default if raw is None else raw
 
 
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+
+
+# Typed helpers return the default directly when unset (the common case) instead of
+# round-tripping it through str() and the parser.
 def _env_bool(name: str, default: bool) -> bool:
-    raw = _env(name, str(default))
-    return raw.lower() in {"1", "true", "yes", "on"}
+    raw = _env_raw(name)
+    if raw is None:
+        return default
+    # exact match first: already-lowercase values skip the lower() copy
+    return raw in _TRUE_VALUES or raw.lower() in _TRUE_VALUES
 
 
 def _env_int(name: str, default: int) -> int:
-    raw = _env(name, str(default))
+    raw = _env_raw(name)
+    if raw is None:
+        return default
     try:
         return int(raw)
-    except Exception:
+    except ValueError:
         return default
 
 
 def _env_float(name: str, default: float) -> float:
-    raw = _env(name, str(default))
+    raw = _env_raw(name)
+    if raw is None:
+        return default
     try:
         return float(raw)
-    except Exception:
+    except ValueError:
         return default
 
 
 def _env_time_seconds(name: str, default_seconds: float) -> float:
     """Parse time value with unit suffixes (s, ms, m, h) and return seconds."""
-    raw = _env(name, str(default_seconds))
+    raw = _env_raw(name)
+    if raw is None:
+        return float(default_seconds)
     try:
         # Handle plain numbers (assume seconds)
         if raw.isdigit() or (raw.replace(".", "").isdigit()):
@@ -62,7 +82,7 @@ def _env_time_seconds(name: str, default_seconds: float) -> float:
         else:
             # No recognized suffix, assume seconds
             return float(raw)
-    except Exception:
+    except ValueError:
         return default_seconds
 
 
@@ -136,7 +156,8 @@ class MTDefaults:
     provider: str = _env("LX_MT_PROVIDER", "ct2-nllb")
     model_dir: str = _env("LX_MT_MODEL_DIR", "")
     device: str = _env("LX_MT_DEVICE", "auto")
-    compute_type: str = _env("LX_MT_COMPUTE_TYPE", "int8_float16")
+    # "auto": resolved per device by resolve_mt_compute_type() when the model loads
+    compute_type: str = _env("LX_MT_COMPUTE_TYPE", "auto")
     workers: int = _env_int("LX_MT_WORKERS", 2)
 
     # Language variant configuration (backward compatible)
@@ -160,6 +181,8 @@ class RuntimeDefaults:
     partial_word_cap: int = _env_int("LX_PARTIAL_WORD_CAP", 0)
     save_audio: str = _DEFAULT_SAVE_AUDIO  # off|wav|flac
     save_audio_path: str = _DEFAULT_SAVE_AUDIO_PATH
+    # opt-in: run the capture/feed thread at real-time priority (Linux; needs CAP_SYS_NICE)
+    audio_rt_priority: bool = _env_bool("LX_AUDIO_RT_PRIORITY", False)
 
 
 ASR = ASRDefaults()
@@ -168,6 +191,17 @@ MT = MTDefaults()
 RT = RuntimeDefaults()
 
 
+def resolve_mt_compute_type(compute_type: str | None, device: str) -> str:
+    """CTranslate2 compute type for MT on a resolved ``device`` ("cpu" or "cuda").
+
+    Unset/"auto" picks int8 GEMMs on CPU and int8_float16 on CUDA; any explicit
+    value (LX_MT_COMPUTE_TYPE) is passed through unchanged.
+    """
+    if not compute_type or compute_type == "auto":
+        return "int8_float16" if device == "cuda" else "int8"
+    return compute_type
+
+
 def pick_device() -> tuple[str, str]:
     """Pick (device, dtype).
 
@@ -27,7 +27,7 @@ class ModelDefaults:
     # MT defaults
     mt_model_id: str = ""
     mt_device: str = "auto"
-    mt_compute_type: str = "int8_float16"
+    mt_compute_type: str = "auto"  # resolved per device by the MT provider
 
     # TTS defaults (placeholder for future)
     tts_model_id: str = ""
@@ -110,7 +110,7 @@ class ModelDefaultsManager:
             asr_compute_type=os.getenv("LX_ASR_COMPUTE", "float16"),
             mt_model_id=os.getenv("LX_NLLB_MODEL", "") or os.getenv("LX_M2M_MODEL", ""),
             mt_device=os.getenv("LX_MT_DEVICE", "auto"),
-            mt_compute_type=os.getenv("LX_MT_COMPUTE_TYPE", "int8_float16"),
+            mt_compute_type=os.getenv("LX_MT_COMPUTE_TYPE", "auto"),
             tts_model_id="",  # No env var equivalent yet
             tts_device=os.getenv("LX_DEVICE", "auto"),
         )
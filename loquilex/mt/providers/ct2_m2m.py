@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from typing import Iterable, Iterator
 
+from ...config.defaults import resolve_mt_compute_type
 from ..core.protocol import MTProvider, ProviderCapabilities
 from ..core.types import Lang, QualityMode, MTModelLoadError, MTProviderError
 from ..core.registry import register_provider
@@ -19,8 +20,11 @@ class CT2M2MProvider:
         self._tokenizer = None
         self._model_dir = os.getenv("LX_MT_MODEL_DIR")
         self._device = os.getenv("LX_MT_DEVICE", "auto")
-        self._compute_type = os.getenv("LX_MT_COMPUTE_TYPE", "int8_float16")
+        # Unset/"auto" means pick per device at load time (int8 GEMMs on CPU)
+        self._compute_type = os.getenv("LX_MT_COMPUTE_TYPE")
         self._workers = int(os.getenv("LX_MT_WORKERS", "2"))
+        # Unset means split the cores across the worker replicas at load time
+        self._intra_threads = os.getenv("LX_MT_INTRA_THREADS")
 
         if not self._model_dir:
             raise MTModelLoadError(
@@ -44,11 +48,20 @@ class CT2M2MProvider:
             if device == "auto":
                 device = "cuda" if ct2.get_cuda_device_count() > 0 else "cpu"
 
+            compute_type = resolve_mt_compute_type(self._compute_type, device)
+            if self._intra_threads:
+                intra_threads = int(self._intra_threads)
+            elif device == "cpu":
+                intra_threads = max(1, (os.cpu_count() or 1) // max(1, self._workers))
+            else:
+                intra_threads = 0  # CT2 default
+
             self._model = ct2.Translator(
                 self._model_dir,
                 device=device,
-                compute_type=self._compute_type,
+                compute_type=compute_type,
                 inter_threads=self._workers,
+                intra_threads=intra_threads,
             )
 
             self._tokenizer = M2MTokenizerAdapter()
@@ -91,12 +104,35 @@ class CT2M2MProvider:
     def translate_chunked(
         self, chunks: Iterable[str], src: Lang, tgt: Lang, *, quality: QualityMode = "realtime"
     ) -> Iterator[str]:
-        """Translate sequence of text chunks."""
-        for chunk in chunks:
-            if chunk.strip():
-                yield self.translate_text(chunk, src, tgt, quality=quality)
-            else:
-                yield ""
+        """Translate sequence of text chunks in a single CT2 batch."""
+        chunks = list(chunks)
+        results_text = [""] * len(chunks)
+        todo = [i for i, chunk in enumerate(chunks) if chunk.strip()]
+
+        if todo:
+            self._load_model()
+
+            try:
+                # Encode all non-empty chunks; CT2 decodes them together and
+                # drops finished hypotheses from the batch as it goes
+                batch_tokens = [self._tokenizer.encode(chunks[i], src) for i in todo]
+                target_prefix = self._tokenizer.target_prefix(tgt)
+
+                beam_size = 1 if quality == "realtime" else 2
+                results = self._model.translate_batch(
+                    batch_tokens,
+                    target_prefix=[target_prefix] * len(batch_tokens),
+                    beam_size=beam_size,
+                    max_decoding_length=256,
+                )
+
+                for i, result in zip(todo, results):
+                    results_text[i] = self._tokenizer.decode(result.hypotheses[0])
+
+            except Exception as e:
+                raise MTProviderError(f"Translation failed: {e}")
+
+        yield from results_text
 
     def capabilities(self) -> ProviderCapabilities:
         """Get provider capabilities."""
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Iterator, Optional
 
@@ -22,6 +24,9 @@ class TranslationResult:
     tgt_lang: Lang
 
 
+_CACHE_MAX = 1024
+
+
 class MTService:
     """High-level MT service using the new provider architecture."""
 
@@ -30,6 +35,9 @@ class MTService:
         self._provider_name = provider_name or os.getenv("LX_MT_PROVIDER", "ct2-nllb")
         self._provider = None
         self._provider_available = None
+        # LRU of successful translations; cumulative ASR partials repeat the same text often
+        self._cache: OrderedDict[tuple[str, str, str, str], TranslationResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def _get_provider(self):
         """Lazy load the MT provider."""
@@ -53,6 +61,20 @@ class MTService:
 
         return self._provider
 
+    def _cache_get(self, key: tuple[str, str, str, str]) -> Optional[TranslationResult]:
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+            return hit
+
+    def _cache_put(self, key: tuple[str, str, str, str], result: TranslationResult) -> None:
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > _CACHE_MAX:
+                self._cache.popitem(last=False)
+
     def is_available(self) -> bool:
         """Check if MT service is available (has working provider)."""
         try:
@@ -72,6 +94,11 @@ class MTService:
         if not text.strip():
             return TranslationResult("", "echo", quality, "en", "en")
 
+        key = (text, src_lang, tgt_lang, quality)
+        hit = self._cache_get(key)
+        if hit is not None:
+            return hit
+
         try:
             provider = self._get_provider()
 
@@ -82,13 +109,15 @@ class MTService:
             # Translate using provider
             result_text = provider.translate_text(text, src, tgt, quality=quality)
 
-            return TranslationResult(
+            result = TranslationResult(
                 text=result_text,
                 provider=self._provider_name or "unknown",
                 quality=quality,
                 src_lang=src,
                 tgt_lang=tgt,
             )
+            self._cache_put(key, result)
+            return result
 
         except Exception:
             # Fall back to echo on any error
@@ -129,6 +158,54 @@ class MTService:
                     text=chunk, provider="echo", quality=quality, src_lang="en", tgt_lang="en"
                 )
 
+    def translate_batch(
+        self, texts: list[str], src_lang: str, tgt_lang: str, *, quality: QualityMode = "realtime"
+    ) -> list[TranslationResult]:
+        """Translate several independent texts in one call; results are positional.
+
+        Cached texts are served from the LRU; only the distinct misses reach the provider.
+        """
+        if not texts:
+            return []
+
+        results = [self._cache_get((text, src_lang, tgt_lang, quality)) for text in texts]
+        misses = list(dict.fromkeys(text for text, r in zip(texts, results) if r is None))
+        if not misses:
+            return [r for r in results if r is not None]
+
+        try:
+            provider = self._get_provider()
+
+            # Normalize language codes
+            src = normalize_lang(src_lang)
+            tgt = normalize_lang(tgt_lang)
+
+            # Materialize inside the try so a mid-batch failure falls back as a whole
+            result_texts = list(provider.translate_chunked(misses, src, tgt, quality=quality))
+
+        except Exception:
+            # Fall back to echo on any error (not cached, so a later call can retry)
+            return [
+                r
+                or TranslationResult(
+                    text=text, provider="echo", quality=quality, src_lang="en", tgt_lang="en"
+                )
+                for text, r in zip(texts, results)
+            ]
+
+        translated: dict[str, TranslationResult] = {}
+        for text, result_text in zip(misses, result_texts):
+            translated[text] = TranslationResult(
+                text=result_text,
+                provider=self._provider_name or "unknown",
+                quality=quality,
+                src_lang=src,
+                tgt_lang=tgt,
+            )
+            self._cache_put((text, src_lang, tgt_lang, quality), translated[text])
+
+        return [r or translated[text] for text, r in zip(texts, results)]
+
     def get_capabilities(self):
         """Get capabilities of the active provider."""
         try:
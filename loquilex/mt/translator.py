@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
 from loquilex.config.defaults import MT, pick_device
 from loquilex.mt.core.util import normalize_lang
@@ -11,13 +12,16 @@ from ..logging import PerformanceMetrics, create_logger
 
 from typing import Any
 
-if TYPE_CHECKING:
-    torch: Any
-else:
+
+@functools.lru_cache(maxsize=1)
+def _get_torch() -> Any:
+    """Import torch on first use (None if unavailable) so importing this module stays cheap."""
     try:  # optional dependency
         import torch
     except Exception:  # torch might not be installed in test env
-        torch = None
+        return None
+    return torch
+
 
 if TYPE_CHECKING:  # only for typing; avoid runtime hard dep
     pass
@@ -98,12 +102,20 @@ class Translator:
         device, _ = pick_device()
         self.device_str = device
         is_cuda = False
+        torch = _get_torch()
         if torch is not None and device == "cuda":
             try:
                 is_cuda = torch.cuda.is_available()
             except Exception:
                 is_cuda = False
         self.torch_device = "cuda" if is_cuda else "cpu"
+        # Dedicated stream so MT kernels don't queue behind other work on the default stream
+        self._stream = None
+        if is_cuda:
+            try:
+                self._stream = torch.cuda.Stream()
+            except Exception:
+                self._stream = None
         self._nllb = None
         self._m2m = None
 
@@ -128,6 +140,21 @@ class Translator:
             cuda_available=is_cuda,
         )
 
+    @contextlib.contextmanager
+    def _inference(self) -> Iterator[None]:
+        """no_grad + the MT stream (if any); synchronizes so outputs are ready to decode."""
+        torch = _get_torch()
+        with contextlib.ExitStack() as stack:
+            if torch is not None:
+                stack.enter_context(torch.no_grad())
+            if self._stream is not None:
+                # Inputs were copied on the current stream; order the MT stream after them
+                self._stream.wait_stream(torch.cuda.current_stream())
+                stack.enter_context(torch.cuda.stream(self._stream))
+            yield
+        if self._stream is not None:
+            self._stream.synchronize()
+
     def translate(
         self,
         text: str,
@@ -200,13 +227,12 @@ class Translator:
             tok.src_lang = src_flores
             inputs = tok(text, return_tensors="pt", truncation=True, max_length=MT.max_input_tokens)
             inputs = {k: v.to(self.torch_device) for k, v in inputs.items()}
-            cm = torch.no_grad() if torch is not None else contextlib.nullcontext()
 
             # Adjust generation params based on quality
             beam_size = 1 if is_draft else MT.num_beams
             max_tokens = min(DRAFT_MAX_TOKENS, MT.max_new_tokens) if is_draft else MT.max_new_tokens
 
-            with cm:
+            with self._inference():
                 gen = model.generate(
                     **inputs,
                     forced_bos_token_id=tok.convert_tokens_to_ids(tgt_flores),
@@ -260,12 +286,11 @@ class Translator:
             tok.src_lang = src_m2m
             inputs = tok(text, return_tensors="pt", truncation=True, max_length=MT.max_input_tokens)
             inputs = {k: v.to(self.torch_device) for k, v in inputs.items()}
-            cm = torch.no_grad() if torch is not None else contextlib.nullcontext()
 
             beam_size = 1 if is_draft else MT.num_beams
             max_tokens = min(DRAFT_MAX_TOKENS, MT.max_new_tokens) if is_draft else MT.max_new_tokens
 
-            with cm:
+            with self._inference():
                 gen = model.generate(
                     **inputs,
                     forced_bos_token_id=tok.get_lang_id(tgt_m2m),
@@ -318,6 +343,82 @@ class Translator:
             duration_ms=duration_ms,
         )
 
+    def translate_batch(
+        self,
+        texts: list[str],
+        src_lang: str = "en",
+        tgt_lang: str = "zh",
+        quality: str = "final",
+    ) -> list[TranslationResult]:
+        """Translate several texts with one padded NLLB ``generate`` call; results are positional.
+
+        Falls back to per-text ``translate`` (M2M, then echo) if the batched path fails.
+        """
+        items = [t.strip() for t in texts]
+        if len(items) <= 1 or not all(items):
+            return [self.translate(t, src_lang, tgt_lang, quality) for t in items]
+
+        is_draft = quality in ("realtime", "draft")
+        self.metrics.start_timer("translation_latency")
+        try:
+            src = normalize_lang(src_lang)
+            tgt = normalize_lang(tgt_lang)
+            tok, model = self._load_nllb()
+
+            tok.src_lang = NLLB_FLORES_MAP.get(src, "eng_Latn")
+            inputs = tok(
+                items,
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=MT.max_input_tokens,
+            )
+            inputs = {k: v.to(self.torch_device) for k, v in inputs.items()}
+
+            beam_size = 1 if is_draft else MT.num_beams
+            max_tokens = min(DRAFT_MAX_TOKENS, MT.max_new_tokens) if is_draft else MT.max_new_tokens
+
+            with self._inference():
+                gen = model.generate(
+                    **inputs,
+                    forced_bos_token_id=tok.convert_tokens_to_ids(
+                        NLLB_FLORES_MAP.get(tgt, "zho_Hans")
+                    ),
+                    num_beams=beam_size,
+                    no_repeat_ngram_size=(
+                        MT.no_repeat_ngram_size if not is_draft else DRAFT_NO_REPEAT_NGRAM_SIZE
+                    ),
+                    max_new_tokens=max_tokens,
+                )
+            outs = tok.batch_decode(gen, skip_special_tokens=True)
+            if len(outs) != len(items):
+                raise RuntimeError(f"batch size mismatch: {len(outs)} != {len(items)}")
+        except Exception as e:
+            self.metrics.end_timer("translation_latency")
+            self.logger.warning(
+                "Batched NLLB translation failed, translating per item",
+                error=str(e),
+                batch_size=len(items),
+            )
+            return [self.translate(t, src_lang, tgt_lang, quality) for t in items]
+
+        duration_ms = self.metrics.end_timer("translation_latency")
+        self.metrics.increment_counter("translations_success", len(items))
+        self.logger.info(
+            "Batch translation completed successfully",
+            method="nllb",
+            src_lang=src,
+            tgt_lang=tgt,
+            quality=quality,
+            batch_size=len(items),
+            duration_ms=duration_ms,
+        )
+        model_name = f"{MT.nllb_model}:{quality}"
+        return [
+            TranslationResult(out, model_name, src_lang=src, tgt_lang=tgt, duration_ms=duration_ms)
+            for out in outs
+        ]
+
     def _load_nllb(self):
         if self._nllb is None:
             self.logger.info("Loading NLLB model", model=MT.nllb_model)
@@ -330,7 +431,7 @@ class Translator:
                 model = AutoModelForSeq2SeqLM.from_pretrained(
                     MT.nllb_model,
                     device_map=None,
-                    **_dtype_kwargs(torch, self.torch_device),
+                    **_dtype_kwargs(_get_torch(), self.torch_device),
                 )
                 model.to(self.torch_device).eval()
                 self._nllb = (tok, model)
@@ -365,7 +466,7 @@ class Translator:
                 model = M2M100ForConditionalGeneration.from_pretrained(
                     MT.m2m_model,
                     device_map=None,
-                    **_dtype_kwargs(torch, self.torch_device),
+                    **_dtype_kwargs(_get_torch(), self.torch_device),
                 )
                 model.to(self.torch_device).eval()
                 self._m2m = (tok, model)
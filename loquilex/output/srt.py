@@ -30,9 +30,59 @@ def write_srt(cues: List[Tuple[float, float, str]], path: str) -> None:
         clean.append((a, b, t.strip()))
         last_end = b
 
+    body = "".join(
+        f"{i}\n{_ts(a)} --> {_ts(b)}\n{t}\n\n" for i, (a, b, t) in enumerate(clean, start=1)
+    )
     with open(path, "w", encoding="utf-8") as f:
-        for i, (a, b, t) in enumerate(clean, start=1):
-            f.write(f"{i}\n{_ts(a)} --> {_ts(b)}\n{t}\n\n")
+        f.write(body)
+
+
+def _read_last_srt_cue(path: str) -> Tuple[int, float]:
+    """(next index, last end time) from an existing SRT file; (1, 0.0) if none/unreadable."""
+    next_idx = 1
+    last_end = 0.0
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            chunk = 8192
+            data = b""
+            while size > 0 and (b"-->" not in data or b"\n\n" not in data):
+                step = min(chunk, size)
+                size -= step
+                f.seek(size)
+                data = f.read(step) + data
+        txt = data.decode("utf-8", errors="ignore")
+        # Find the last complete cue block
+        blocks = [b for b in txt.split("\n\n") if "-->" in b]
+        if blocks:
+            last = blocks[-1].splitlines()
+            try:
+                next_idx = int(last[0]) + 1
+            except Exception:
+                next_idx = 1
+            try:
+                tsline = [ln for ln in last if "-->" in ln][0]
+                right = tsline.split("-->")[1].strip().split(" ")[0]
+                hh, mm, ss_ms = right.split(":")
+                ss, ms = ss_ms.split(",")
+                last_end = int(hh) * 3600 + int(mm) * 60 + int(ss) + int(ms) / 1000.0
+            except Exception:
+                last_end = 0.0
+    except Exception:
+        next_idx = 1
+        last_end = 0.0
+    return next_idx, last_end
+
+
+def _format_cue(
+    idx: int, last_end: float, start: float, end: float, text: str
+) -> Tuple[float, str]:
+    a = max(start, last_end + EPS)
+    b = end
+    if b <= a:
+        b = a + EPS
+    return b, f"{idx}\n{_ts(a)} --> {_ts(b)}\n{text.strip()}\n\n"
 
 
 def append_srt_cue(path: str, index: int | None, start: float, end: float, text: str) -> int:
@@ -46,45 +96,46 @@ def append_srt_cue(path: str, index: int | None, start: float, end: float, text:
     next_idx = 1
     last_end = 0.0
     if os.path.exists(path):
-        try:
-            with open(path, "rb") as f:
-                f.seek(0, os.SEEK_END)
-                size = f.tell()
-                chunk = 8192
-                data = b""
-                while size > 0 and (b"-->" not in data or b"\n\n" not in data):
-                    step = min(chunk, size)
-                    size -= step
-                    f.seek(size)
-                    data = f.read(step) + data
-            txt = data.decode("utf-8", errors="ignore")
-            # Find the last complete cue block
-            blocks = [b for b in txt.split("\n\n") if "-->" in b]
-            if blocks:
-                last = blocks[-1].splitlines()
-                try:
-                    next_idx = int(last[0]) + 1
-                except Exception:
-                    next_idx = 1
-                try:
-                    tsline = [ln for ln in last if "-->" in ln][0]
-                    right = tsline.split("-->")[1].strip().split(" ")[0]
-                    hh, mm, ss_ms = right.split(":")
-                    ss, ms = ss_ms.split(",")
-                    last_end = int(hh) * 3600 + int(mm) * 60 + int(ss) + int(ms) / 1000.0
-                except Exception:
-                    last_end = 0.0
-        except Exception:
-            next_idx = 1
-            last_end = 0.0
+        next_idx, last_end = _read_last_srt_cue(path)
     if index is not None:
         next_idx = index
 
-    a = max(start, last_end + EPS)
-    b = end
-    if b <= a:
-        b = a + EPS
-    cue = f"{next_idx}\n{_ts(a)} --> {_ts(b)}\n{text.strip()}\n\n"
+    _, cue = _format_cue(next_idx, last_end, start, end, text)
     with open(path, "a", encoding="utf-8") as f:
         f.write(cue)
     return next_idx
+
+
+class SrtCueAppender:
+    """Buffered ``append_srt_cue`` for one file: same output, one write per ``flush()``.
+
+    Next index and last end are read from the file once and then tracked in memory;
+    ``start_index`` overrides the file-derived index like ``append_srt_cue``'s ``index``.
+    """
+
+    def __init__(self, path: str, start_index: int | None = None) -> None:
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._next_idx, self._last_end = (
+            _read_last_srt_cue(path) if os.path.exists(path) else (1, 0.0)
+        )
+        if start_index is not None:
+            self._next_idx = start_index
+        self._pending: List[str] = []
+
+    def add(self, start: float, end: float, text: str) -> int:
+        """Queue a cue; returns the index it was given."""
+        idx = self._next_idx
+        self._last_end, cue = _format_cue(idx, self._last_end, start, end, text)
+        self._pending.append(cue)
+        self._next_idx = idx + 1
+        return idx
+
+    def flush(self) -> None:
+        # Swap rather than clear so a cue added concurrently lands in the next flush
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        body = "".join(pending)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(body)
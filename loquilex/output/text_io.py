@@ -11,11 +11,24 @@ def _ensure_parent_dir(path: str) -> None:
         os.makedirs(d, exist_ok=True)
 
 
-def _write_atomic(path: str, text: str) -> None:
-    tmp = path + ".tmp"
-    with open(tmp, "w", encoding="utf-8", newline="\n") as f:
-        f.write(text)
-    os.replace(tmp, path)
+def write_atomic(path: str, text: str) -> None:
+    """Replace ``path`` with ``text`` via a temp file in the same directory.
+
+    The temp name is unique per process/thread so concurrent writers never share it,
+    and it is removed if the write or rename fails. No fsync: these files are rewritten
+    at partial-update rate and only need readers to never see a torn file.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 class RollingTextFile:
@@ -32,6 +45,7 @@ class RollingTextFile:
         self.max_lines = max_lines if (max_lines is None or max_lines > 0) else None
         self._final_lines: List[str] = []  # stored without trailing \n
         self._lock = threading.Lock()
+        self._written: Optional[str] = None  # last contents this writer put on disk
         if ensure_dir:
             _ensure_parent_dir(self.path)
 
@@ -65,13 +79,18 @@ class RollingTextFile:
         with self._lock:
             self._final_lines.clear()
             _ensure_parent_dir(self.path)
-            _write_atomic(self.path, "")
+            write_atomic(self.path, "")
+            self._written = ""
 
     def rewrite_current_line(self, line: str) -> None:
         # Replace entire file with finalized lines + one draft line
         with self._lock:
             text = self._serialize(line)
-            _write_atomic(self.path, text)
+            # Repeated drafts (common at pauses) would rewrite identical bytes; skip them
+            if text == self._written:
+                return
+            write_atomic(self.path, text)
+            self._written = text
 
     def append_final_line(self, line: str) -> None:
         line = (line or "").rstrip("\n")
@@ -86,4 +105,5 @@ class RollingTextFile:
                 if overflow > 0:
                     self._final_lines = self._final_lines[overflow:]
             text = self._serialize(None)
-            _write_atomic(self.path, text)
+            write_atomic(self.path, text)
+            self._written = text
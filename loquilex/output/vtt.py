@@ -33,27 +33,13 @@ def write_vtt(cues: List[Tuple[float, float, str]], path: str) -> None:
         clean.append((a, b, t))
         last_end = b
 
+    body = "".join(f"{_ts(a)} --> {_ts(b)}\n{t}\n\n" for a, b, t in clean)
     with open(path, "w", encoding="utf-8") as f:
-        f.write("WEBVTT\n\n")
-        for a, b, t in clean:
-            f.write(f"{_ts(a)} --> {_ts(b)}\n{t}\n\n")
+        f.write("WEBVTT\n\n" + body)
 
 
-def append_vtt_cue(path: str, start: float, end: float, text: str) -> None:
-    """Append a single VTT cue, creating file+header if needed.
-
-    Applies epsilon bump and monotonic enforcement by checking the last cue in file if present.
-    """
-    d = os.path.dirname(path)
-    if d:
-        os.makedirs(d, exist_ok=True)
-
-    # Ensure file exists with header
-    if not os.path.exists(path):
-        with open(path, "w", encoding="utf-8") as f:
-            f.write("WEBVTT\n\n")
-
-    # Read last end time by scanning backwards a bit (cheap for typical files)
+def _read_last_vtt_end(path: str) -> float:
+    """End time of the last cue in an existing VTT file (0.0 if none/unreadable)."""
     last_end = 0.0
     try:
         with open(path, "rb") as f:
@@ -80,14 +66,65 @@ def append_vtt_cue(path: str, start: float, end: float, text: str) -> None:
                 last_end = 0.0
     except Exception:
         last_end = 0.0
+    return last_end
 
+
+def _format_cue(last_end: float, start: float, end: float, text: str) -> Tuple[float, str]:
     a = max(start, last_end + EPS)
     b = end
     if b <= a:
         b = a + EPS
+    return b, f"{_ts(a)} --> {_ts(b)}\n{text.strip()}\n\n"
+
+
+def append_vtt_cue(path: str, start: float, end: float, text: str) -> None:
+    """Append a single VTT cue, creating file+header if needed.
 
-    cue = f"{_ts(a)} --> {_ts(b)}\n{text.strip()}\n\n"
+    Applies epsilon bump and monotonic enforcement by checking the last cue in file if present.
+    """
+    d = os.path.dirname(path)
+    if d:
+        os.makedirs(d, exist_ok=True)
+
+    # Ensure file exists with header
+    if not os.path.exists(path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("WEBVTT\n\n")
+
+    # Read last end time by scanning backwards a bit (cheap for typical files)
+    last_end = _read_last_vtt_end(path)
+    _, cue = _format_cue(last_end, start, end, text)
     # Append atomically: write tmp then concatenate with existing file content would be heavy; instead
     # for appends we can open in append mode which is atomic at OS-level for writes.
     with open(path, "a", encoding="utf-8") as f:
         f.write(cue)
+
+
+class VttCueAppender:
+    """Buffered ``append_vtt_cue`` for one file: same output, one write per ``flush()``.
+
+    The last cue end is read from the file once and then tracked in memory, so adding a
+    cue costs no I/O; the caller flushes at its natural batch boundaries.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        self._last_end = _read_last_vtt_end(path) if os.path.exists(path) else 0.0
+        self._pending: List[str] = []
+
+    def add(self, start: float, end: float, text: str) -> None:
+        self._last_end, cue = _format_cue(self._last_end, start, end, text)
+        self._pending.append(cue)
+
+    def flush(self) -> None:
+        # Swap rather than clear so a cue added concurrently lands in the next flush
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        body = "".join(pending)
+        header = "" if os.path.exists(self.path) else "WEBVTT\n\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(header + body)
@@ -13,14 +13,16 @@ PUNCT_MAP = {
 }
 
 
+_PUNCT_TABLE = str.maketrans(PUNCT_MAP)
+_WS_RE = re.compile(r"\s+")
+_CJK_PUNCT_SPACE_RE = re.compile(r"\s*([，。！？：；])\s*")
+
+
 def normalize_punctuation(s: str) -> str:
-    out = []
-    for ch in s:
-        out.append(PUNCT_MAP.get(ch, ch))
-    s2 = "".join(out)
+    s2 = s.translate(_PUNCT_TABLE)
     # Collapse spaces around CJK
-    s2 = re.sub(r"\s+", " ", s2).strip()
-    s2 = re.sub(r"\s*([，。！？：；])\s*", r"\1", s2)
+    s2 = _WS_RE.sub(" ", s2).strip()
+    s2 = _CJK_PUNCT_SPACE_RE.sub(r"\1", s2)
     return s2
 
 
@@ -12,6 +12,11 @@ class TranslationResult:
     duration_ms: float = 0.0
     confidence: float | None = None
 
+    @property
+    def provider(self) -> str:
+        # MTService results name the backend "provider"; alias it for callers of that API
+        return self.model
+
 
 class Translator:
     def translate(
@@ -29,3 +34,12 @@ class Translator:
             tgt_lang=tgt_lang,
             duration_ms=0.0,
         )
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        src_lang: str = "en",
+        tgt_lang: str = "zh",
+        quality: str = "final",
+    ) -> list[TranslationResult]:
+        return [self.translate(t, src_lang, tgt_lang, quality) for t in texts]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 
 def test_import_api_modules_for_coverage():
     # Import FastAPI modules if available; otherwise skip gracefully
@@ -19,7 +21,7 @@ def test_import_api_modules_for_coverage():
     import numpy as np
 
     from loquilex.api.events import EventStamper
-    from loquilex.api.vu import EmaVu, rms_peak
+    from loquilex.api.vu import EmaVu, rms_peak, rms_peak_clip
 
     st = EventStamper.new()
     out = st.stamp({"type": "x"})
@@ -28,6 +30,12 @@ def test_import_api_modules_for_coverage():
     r, p = rms_peak(np.array([0.0, 0.3, -0.5], dtype=np.float32))
     assert 0.0 <= r <= 1.0 and 0.0 <= p <= 1.0
 
+    x = np.array([0.0, 0.3, -0.5, 1.2, -0.9995], dtype=np.float32)
+    r3, p3, clip = rms_peak_clip(x, np.empty(8, dtype=np.float32))
+    assert (r3, p3) == pytest.approx(rms_peak(x))
+    assert clip == pytest.approx(2 / 5)
+    assert rms_peak_clip(np.zeros(0, dtype=np.float32)) == (0.0, 0.0, 0.0)
+
     vu = EmaVu(alpha=0.5)
     r1, p1 = vu.update(r, p)
     r2, p2 = vu.update(r, p)
@@ -0,0 +1,416 @@
+"""Unit tests for the demo CLI's writer thread, MT batching and mic ring."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from loquilex.asr.stream import ASRFinalEvent, ASRPartialEvent
+from loquilex.cli import demo
+from tests.fakes.fake_mt import Translator as FakeTranslator
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def _start_writer(tmp_path: Path, **kwargs):
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    events = tmp_path / "events.jsonl"
+    transcript = tmp_path / "transcript.txt"
+    th = threading.Thread(
+        target=demo._writer_loop, args=(q, events, transcript), kwargs=kwargs, daemon=True
+    )
+    th.start()
+    return q, th, events, transcript
+
+
+def test_writer_flushes_when_buffer_reaches_size(tmp_path):
+    q, th, events, _ = _start_writer(tmp_path, flush_bytes=16, flush_interval_s=60.0)
+    q.put(("event", {"type": "asr.partial", "text": "long enough to pass the size limit"}))
+
+    assert _wait_for(lambda: events.exists() and events.stat().st_size > 0)
+    q.put(None)
+    th.join(timeout=2.0)
+    assert json.loads(events.read_text(encoding="utf-8"))["type"] == "asr.partial"
+
+
+def test_writer_flushes_after_interval(tmp_path):
+    q, th, _, transcript = _start_writer(tmp_path, flush_bytes=1 << 20, flush_interval_s=0.05)
+    q.put(("transcript", "hello"))
+
+    assert _wait_for(lambda: transcript.exists() and transcript.read_bytes() == b"hello\n")
+    q.put(None)
+    th.join(timeout=2.0)
+
+
+def test_writer_drains_on_sentinel_and_strips_unicode(tmp_path):
+    q, th, events, transcript = _start_writer(tmp_path, flush_bytes=1 << 20, flush_interval_s=60.0)
+    q.put(("event", {"type": "mt.final", "text_tgt": "你好"}))
+    q.put(("transcript", "　你好 \n"))
+    q.put(("transcript", "世界"))
+    q.put(None)
+    th.join(timeout=2.0)
+
+    assert not th.is_alive()
+    assert json.loads(events.read_text(encoding="utf-8")) == {
+        "type": "mt.final",
+        "text_tgt": "你好",
+    }
+    assert transcript.read_text(encoding="utf-8") == "你好\n世界\n"
+
+
+def test_writer_skips_records_that_fail_to_encode(tmp_path):
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    for item in [("event", {"bad": object()}), ("event", {"ok": 1}), None]:
+        q.put(item)
+
+    demo._writer_loop(q, tmp_path / "events.jsonl", tmp_path / "transcript.txt")
+
+    assert (tmp_path / "events.jsonl").read_text(encoding="utf-8") == '{"ok":1}\n'
+
+
+def test_writer_drains_queue_then_raises_io_error(tmp_path):
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    for item in [("event", {"ok": 1}), ("transcript", "hi"), None]:
+        q.put(item)
+
+    # a directory cannot be opened for append
+    with pytest.raises(OSError):
+        demo._writer_loop(q, tmp_path, tmp_path / "transcript.txt")
+    assert q.empty()
+
+    q.put(None)
+    writer = demo._WriterThread(q, tmp_path, tmp_path / "transcript.txt")
+    writer.start()
+    writer.join(timeout=2.0)
+    assert isinstance(writer.error, OSError)
+
+
+async def test_batcher_flushes_at_max_batch_size():
+    batches: list[list[int]] = []
+    batcher = demo._AsyncBatcher(batches.append, max_batch_size=3, max_wait_ms=10_000)
+
+    for i in range(4):
+        batcher.submit(i)
+
+    assert batches == [[0, 1, 2]]
+    batcher.flush()
+    assert batches == [[0, 1, 2], [3]]
+
+
+async def test_batcher_flushes_after_max_wait():
+    batches: list[list[int]] = []
+    batcher = demo._AsyncBatcher(batches.append, max_batch_size=8, max_wait_ms=20)
+
+    batcher.submit(1)
+    batcher.submit(2)
+    assert batches == []
+
+    await asyncio.sleep(0.1)
+    assert batches == [[1, 2]]
+
+
+async def test_batcher_flush_cancels_pending_timer():
+    batches: list[list[int]] = []
+    batcher = demo._AsyncBatcher(batches.append, max_batch_size=8, max_wait_ms=20)
+
+    batcher.submit(1)
+    timer = batcher._timer
+    assert timer is not None
+    batcher.flush()
+
+    assert timer.cancelled()
+    assert batcher._timer is None
+    await asyncio.sleep(0.05)
+    assert batches == [[1]]
+
+
+async def test_batcher_logs_failures_and_keeps_processing(caplog):
+    batches: list[list[int]] = []
+
+    def process(batch: list[int]) -> None:
+        if batch == [1]:
+            raise RuntimeError("boom")
+        batches.append(batch)
+
+    batcher = demo._AsyncBatcher(process, max_batch_size=1, max_wait_ms=20)
+
+    with caplog.at_level(logging.ERROR, logger="loquilex.demo"):
+        batcher.submit(1)
+        batcher.submit(2)
+
+    assert batches == [[2]]
+    assert "batch processing failed" in caplog.text
+
+
+def _make_handlers(partials: bool = True):
+    records: list = []
+    stats = {"partials": 0, "finals": 0}
+    latencies = demo._LatencyHistogram()
+    handlers = demo._MTEventHandlers(
+        FakeTranslator(), records.append, "en", "zh", partials, stats, latencies
+    )
+    return handlers, records, stats, latencies
+
+
+def _mt_events(records: list, typ: str) -> list[dict]:
+    return [p for k, p in records if k == "event" and isinstance(p, dict) and p["type"] == typ]
+
+
+async def test_batched_finals_keep_seq_order_and_latency():
+    handlers, records, stats, latencies = _make_handlers()
+    t0 = time.monotonic()
+    finals = [
+        ASRFinalEvent(segment_id=f"s{i}", text=f"final {i}", ts_monotonic=t0 - i) for i in range(3)
+    ]
+
+    for ev in finals:
+        handlers.handlers["asr.final"](ev)
+    handlers.flush()
+
+    mt_finals = _mt_events(records, "mt.final")
+    assert [e["seq"] for e in mt_finals] == [1, 2, 3]
+    assert [e["segment_id"] for e in mt_finals] == ["s0", "s1", "s2"]
+    assert [e["text_tgt"] for e in mt_finals] == ["[zh]final 0", "[zh]final 1", "[zh]final 2"]
+    assert all(e["provider"] == "echo" for e in mt_finals)
+    for i, e in enumerate(mt_finals):
+        assert e["t0_ms"] == int(finals[i].ts_monotonic * 1000)
+        assert e["latency_ms"] == pytest.approx((e["t1_ms"] - e["t0_ms"]), abs=1.0)
+        assert e["latency_ms"] >= i * 1000.0
+    transcript = [p for k, p in records if k == "transcript"]
+    assert transcript == ["[zh]final 0", "[zh]final 1", "[zh]final 2"]
+    assert stats["finals"] == 3 and latencies.count == 3
+
+
+async def test_batched_partials_are_zipped_to_their_source():
+    handlers, records, stats, _ = _make_handlers()
+
+    for i, text in enumerate(["alpha", "bravo", "charlie"]):
+        handlers.handlers["asr.partial"](ASRPartialEvent(segment_id=f"s{i}", text=text))
+    handlers.flush()
+
+    mt_partials = _mt_events(records, "mt.partial")
+    assert [(e["text_src"], e["text_tgt"]) for e in mt_partials] == [
+        ("alpha", "[zh]alpha"),
+        ("bravo", "[zh]bravo"),
+        ("charlie", "[zh]charlie"),
+    ]
+    assert len({e["ts_monotonic"] for e in mt_partials}) == 1
+    assert stats["partials"] == 3
+
+
+def _translated_partials(records: list) -> list[str]:
+    return [e["text_src"] for e in _mt_events(records, "mt.partial")]
+
+
+async def test_identical_partial_is_not_retranslated():
+    handlers, records, stats, _ = _make_handlers()
+
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello there"))
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello there"))
+    handlers.flush()
+
+    assert _translated_partials(records) == ["hello there"]
+    assert stats["partials"] == 2
+
+
+async def test_small_unstable_extension_is_skipped_until_delta_reached():
+    handlers, records, _, _ = _make_handlers()
+
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello"))
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello the"))  # +4 chars
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello there you"))  # +10
+    handlers.flush()
+
+    assert _translated_partials(records) == ["hello", "hello there you"]
+
+
+async def test_stable_partial_is_translated_even_when_close():
+    handlers, records, _, _ = _make_handlers()
+
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello"))
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello!", stable=True))
+    handlers.flush()
+
+    assert _translated_partials(records) == ["hello", "hello!"]
+
+
+async def test_final_drops_segment_partial_state():
+    handlers, records, _, _ = _make_handlers()
+
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello"))
+    assert "s" in handlers._last_mt_partial
+    handlers.handle_final(ASRFinalEvent(segment_id="s", text="hello"))
+    assert "s" not in handlers._last_mt_partial
+
+    # same segment id again starts fresh, so an identical text is translated again
+    handlers.handle_partial(ASRPartialEvent(segment_id="s", text="hello"))
+    handlers.flush()
+
+    assert _translated_partials(records) == ["hello", "hello"]
+
+
+def _block(value: float, n: int) -> np.ndarray:
+    return np.full(n, value, dtype=np.float32)
+
+
+def _drain_copy(ring) -> list[np.ndarray]:
+    out: list[np.ndarray] = []
+    ring.drain(lambda chunk: out.append(chunk.copy()))
+    return out
+
+
+def test_audio_ring_wraps_around_in_order():
+    ring = demo._AudioRing(n_slots=2, blocksize=4)
+    seen = []
+    for i in range(5):
+        assert ring.push(_block(i, 4), 4)
+        seen += [b[0] for b in _drain_copy(ring)]
+
+    assert seen == [0, 1, 2, 3, 4]
+
+
+def test_audio_ring_drops_when_all_slots_outstanding():
+    ring = demo._AudioRing(n_slots=2, blocksize=4)
+    assert ring.push(_block(1, 4), 4)
+    assert ring.push(_block(2, 4), 4)
+    assert not ring.push(_block(3, 4), 4)
+
+    assert [b[0] for b in _drain_copy(ring)] == [1, 2]
+    assert ring.push(_block(4, 4), 4)
+    assert [b[0] for b in _drain_copy(ring)] == [4]
+
+
+def test_audio_ring_releases_slot_only_after_consume():
+    ring = demo._AudioRing(n_slots=2, blocksize=4)
+    ring.push(_block(1, 4), 4)
+    ring.push(_block(2, 4), 4)
+    pushed_during_consume = []
+
+    def consume(chunk):
+        # the block being consumed still occupies its slot
+        if chunk[0] in (1, 2):
+            pushed_during_consume.append(ring.push(_block(9, 4), 4))
+
+    ring.drain(consume)
+
+    # first consume saw a full ring; after its release the second consume could push
+    assert pushed_during_consume == [False, True]
+
+
+def test_audio_ring_keeps_short_and_truncates_long_blocks():
+    ring = demo._AudioRing(n_slots=4, blocksize=4)
+    ring.push(_block(1, 4), 4)
+    ring.push(_block(2, 3), 3)  # short final block
+    ring.push(_block(3, 6), 6)  # longer than blocksize
+
+    assert [b.tolist() for b in _drain_copy(ring)] == [[1] * 4, [2] * 3, [3] * 4]
+
+
+def test_audio_ring_skips_blocks_that_fail_to_process(caplog):
+    ring = demo._AudioRing(n_slots=2, blocksize=2)
+    ring.push(_block(1, 2), 2)
+    ring.push(_block(2, 2), 2)
+    seen = []
+
+    def consume(chunk):
+        if chunk[0] == 1:
+            raise RuntimeError("asr failed")
+        seen.append(chunk[0])
+
+    with caplog.at_level(logging.ERROR, logger="loquilex.demo"):
+        ring.drain(consume)
+
+    assert seen == [2]
+    assert "error processing audio chunk" in caplog.text
+    assert ring.push(_block(3, 2), 2) and ring.push(_block(4, 2), 2)
+
+
+def _write_wav(path: Path, pcm: bytes, sampwidth: int, chans: int = 1) -> None:
+    import wave
+
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(chans)
+        w.setsampwidth(sampwidth)
+        w.setframerate(16000)
+        w.writeframes(pcm)
+
+
+def test_stdlib_wav_fallback_rejects_24_bit(tmp_path):
+    import wave
+
+    path = tmp_path / "pcm24.wav"
+    _write_wav(path, b"\x00\x01\x02" * 1600, sampwidth=3)
+
+    with open(path, "rb") as raw_f, wave.open(raw_f, "rb") as wf:
+        with pytest.raises(ValueError, match="24-bit"):
+            next(demo._wave_pcm_blocks(raw_f, wf, chunk_frames=400))
+
+
+def test_stdlib_wav_fallback_keeps_alignment_across_short_reads(tmp_path):
+    import wave
+
+    pcm = np.arange(-300, 300, dtype=np.int16).reshape(-1, 2)  # 300 stereo frames
+    path = tmp_path / "stereo16.wav"
+    _write_wav(path, pcm.tobytes(), sampwidth=2, chans=2)
+
+    class ShortReads:
+        """readinto() that returns at most 7 bytes, splitting samples and frames."""
+
+        def __init__(self, f):
+            self._f = f
+
+        def readinto(self, b):
+            return self._f.readinto(memoryview(b)[:7])
+
+    with open(path, "rb") as raw_f, wave.open(raw_f, "rb") as wf:
+        blocks = [b.copy() for b in demo._wave_pcm_blocks(ShortReads(raw_f), wf, 64)]
+
+    decoded = np.concatenate(blocks)
+    assert decoded.shape == (300, 2)
+    assert np.array_equal(decoded, pcm.astype(np.float32) / 32768.0)
+
+
+def _interrupted_demo(monkeypatch, session_dir: Path) -> None:
+    """Make main() run a demo that queues one record and then gets Ctrl+C."""
+
+    async def fake_run_demo(*args, **_kwargs):
+        write_q = args[4]
+        write_q.put_nowait(("transcript", "before ctrl-c"))
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(demo, "_make_session_dir", lambda _name: session_dir)
+    monkeypatch.setattr(demo, "_run_demo", fake_run_demo)
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_main_drains_writer_on_keyboard_interrupt(tmp_path, monkeypatch, capsys):
+    _interrupted_demo(monkeypatch, tmp_path)
+
+    assert demo.main(["--wav", "unused.wav"]) == 0
+
+    assert "Interrupted" in capsys.readouterr().out
+    assert (tmp_path / "transcript.txt").read_text(encoding="utf-8") == "before ctrl-c\n"
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_main_raises_writer_error_on_keyboard_interrupt(tmp_path, monkeypatch):
+    _interrupted_demo(monkeypatch, tmp_path)
+    (tmp_path / "events.jsonl").mkdir()  # cannot be opened for append
+
+    with pytest.raises(OSError):
+        demo.main(["--wav", "unused.wav"])
@@ -68,3 +68,33 @@ def test_out_dir_prefers_lx_over_llx(monkeypatch):
 
     importlib.reload(mod)
     assert mod.RT.out_dir == "/tmp/new-out"
+
+
+def test_typed_env_helpers_unset_vs_set(monkeypatch):
+    """Unset variables yield the default as-is; set-but-invalid values still fall back."""
+    from loquilex.config.defaults import _env_bool, _env_float, _env_int
+
+    monkeypatch.delenv("LX_TEST_TYPED", raising=False)
+    assert _env_bool("LX_TEST_TYPED", True) is True
+    assert _env_int("LX_TEST_TYPED", 7) == 7
+    assert _env_float("LX_TEST_TYPED", 0.25) == 0.25
+
+    monkeypatch.setenv("LX_TEST_TYPED", "")
+    assert _env_bool("LX_TEST_TYPED", True) is False
+    assert _env_int("LX_TEST_TYPED", 7) == 7
+    assert _env_float("LX_TEST_TYPED", 0.25) == 0.25
+
+
+def test_mt_compute_type_defaults_to_auto_resolved_per_device(monkeypatch):
+    """Unset LX_MT_COMPUTE_TYPE is reported as "auto" and resolves like the CT2 providers."""
+    from loquilex.config import defaults as mod
+    from loquilex.config.model_defaults import ModelDefaults
+
+    monkeypatch.delenv("LX_MT_COMPUTE_TYPE", raising=False)
+    importlib.reload(mod)
+
+    assert mod.MT.compute_type == "auto"
+    assert ModelDefaults().mt_compute_type == "auto"
+    assert mod.resolve_mt_compute_type(mod.MT.compute_type, "cpu") == "int8"
+    assert mod.resolve_mt_compute_type(None, "cuda") == "int8_float16"
+    assert mod.resolve_mt_compute_type("float32", "cpu") == "float32"
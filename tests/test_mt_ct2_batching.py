@@ -0,0 +1,74 @@
+"""CT2 providers translate chunk sequences in a single batched call."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from loquilex.mt.providers.ct2_m2m import CT2M2MProvider
+from loquilex.mt.providers.ct2_nllb import CT2NLLBProvider
+
+
+class _FakeTokenizer:
+    def encode(self, text, src):  # noqa: ARG002
+        return text.split()
+
+    def target_prefix(self, tgt):
+        return [f"__{tgt}__"]
+
+    def decode(self, tokens):
+        return " ".join(t.upper() for t in tokens if not t.startswith("__"))
+
+
+class _FakeTranslator:
+    def __init__(self):
+        self.calls = []
+
+    def translate_batch(self, source, *, target_prefix, **_kwargs):
+        self.calls.append((source, target_prefix))
+        return [SimpleNamespace(hypotheses=[toks]) for toks in source]
+
+
+@pytest.mark.parametrize("provider_cls", [CT2NLLBProvider, CT2M2MProvider])
+def test_translate_chunked_uses_one_batch(provider_cls, monkeypatch):
+    monkeypatch.setenv("LX_MT_MODEL_DIR", "/nonexistent")
+    provider = provider_cls()
+    fake = _FakeTranslator()
+    provider._model = fake
+    provider._tokenizer = _FakeTokenizer()
+
+    out = list(provider.translate_chunked(["hello there", "", "good bye"], "en", "zh-Hans"))
+
+    assert out == ["HELLO THERE", "", "GOOD BYE"]
+    assert len(fake.calls) == 1
+    source, prefixes = fake.calls[0]
+    assert source == [["hello", "there"], ["good", "bye"]]
+    assert prefixes == [["__zh-Hans__"], ["__zh-Hans__"]]
+
+
+@pytest.mark.parametrize(
+    ("provider_cls", "adapter"),
+    [(CT2NLLBProvider, "NLLBTokenizerAdapter"), (CT2M2MProvider, "M2MTokenizerAdapter")],
+)
+def test_unset_compute_type_resolves_to_int8_on_cpu(provider_cls, adapter, monkeypatch):
+    import importlib
+    import sys
+
+    created = {}
+
+    def fake_translator(model_dir, **kwargs):  # noqa: ARG001
+        created.update(kwargs)
+        return _FakeTranslator()
+
+    fake_ct2 = SimpleNamespace(get_cuda_device_count=lambda: 0, Translator=fake_translator)
+    monkeypatch.setitem(sys.modules, "ctranslate2", fake_ct2)
+    monkeypatch.setenv("LX_MT_MODEL_DIR", "/nonexistent")
+    monkeypatch.delenv("LX_MT_COMPUTE_TYPE", raising=False)
+    monkeypatch.delenv("LX_MT_DEVICE", raising=False)
+    monkeypatch.setattr(importlib.import_module(provider_cls.__module__), adapter, _FakeTokenizer)
+
+    provider_cls()._load_model()
+
+    assert created["device"] == "cpu"
+    assert created["compute_type"] == "int8"
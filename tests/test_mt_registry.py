@@ -104,3 +104,44 @@ def test_ct2_provider_registration():
     except ImportError:
         # Dependencies not available, skip
         pytest.skip("CTranslate2 or transformers not available")
+
+
+def test_service_translate_batch_is_positional():
+    """MTService.translate_batch returns one result per input, in order."""
+    from loquilex.mt.service import MTService
+
+    register_provider("test-mock", MockProvider)
+    service = MTService("test-mock")
+
+    results = service.translate_batch(["hello", "world"], "en", "zh-Hans")
+
+    assert [r.text for r in results] == ["mock-en-zh-Hans-hello", "mock-en-zh-Hans-world"]
+    assert all(r.provider == "test-mock" for r in results)
+    assert service.translate_batch([], "en", "zh-Hans") == []
+
+
+def test_service_caches_repeated_translations():
+    """Repeated texts are served from the service cache without re-invoking the provider."""
+    from loquilex.mt.service import MTService
+
+    calls: list[list[str]] = []
+
+    class CountingProvider(MockProvider):
+        def translate_chunked(self, chunks, src, tgt, *, quality="realtime"):
+            calls.append(list(chunks))
+            return super().translate_chunked(chunks, src, tgt, quality=quality)
+
+    register_provider("test-counting", CountingProvider)
+    service = MTService("test-counting")
+
+    first = service.translate_batch(["hello", "hello", "world"], "en", "zh-Hans")
+    second = service.translate_batch(["world", "again"], "en", "zh-Hans")
+
+    assert calls == [["hello", "world"], ["again"]]
+    assert [r.text for r in first] == [
+        "mock-en-zh-Hans-hello",
+        "mock-en-zh-Hans-hello",
+        "mock-en-zh-Hans-world",
+    ]
+    assert [r.text for r in second] == ["mock-en-zh-Hans-world", "mock-en-zh-Hans-again"]
+    assert service.translate_text("again", "en", "zh-Hans") is second[1]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from loquilex.output.text_io import RollingTextFile
 
 
@@ -38,3 +40,43 @@ def test_utf8_and_trailing_newline(tmp_path):
     # Exactly two lines (plus trailing blank from split)
     parts = txt.split("\n")
     assert parts[:-1] == ["你好，世界", "再见"]
+
+
+def test_atomic_writes_leave_no_temp_files(tmp_path, monkeypatch):
+    import os
+
+    p = tmp_path / "live.partial.en.txt"
+    r = RollingTextFile(str(p))
+    r.rewrite_current_line("hello")
+    assert os.listdir(tmp_path) == [p.name]
+
+    # A failed rename must not strand the temp file next to the target
+    def boom(*_args):
+        raise OSError("rename failed")
+
+    monkeypatch.setattr(os, "replace", boom)
+    with pytest.raises(OSError):
+        r.rewrite_current_line("world")
+    assert os.listdir(tmp_path) == [p.name]
+    assert p.read_text(encoding="utf-8") == "hello\n"
+
+
+def test_rewrite_skips_identical_contents(tmp_path, monkeypatch):
+    import loquilex.output.text_io as text_io
+
+    p = tmp_path / "live.partial.zh.txt"
+    r = RollingTextFile(str(p))
+    writes: list[str] = []
+    real = text_io.write_atomic
+
+    def counting(path, text):
+        writes.append(text)
+        real(path, text)
+
+    monkeypatch.setattr(text_io, "write_atomic", counting)
+    r.rewrite_current_line("draft")
+    r.rewrite_current_line("draft")
+    r.rewrite_current_line("draft 2")
+    r.rewrite_current_line("draft 2")
+    assert writes == ["draft\n", "draft 2\n"]
+    assert p.read_text(encoding="utf-8") == "draft 2\n"
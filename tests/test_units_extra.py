@@ -45,3 +45,24 @@ def test_post_processing():
     assert "，" in s and s.endswith("！")
     s2 = post_process("GPU with RTX 4090, great!")
     assert s2.endswith("！")
+
+
+def test_read_wav_mono_16k_maps_and_downmixes(tmp_path):
+    import wave
+
+    import numpy as np
+
+    from loquilex.cli.wav_to_vtt import read_wav_mono_16k
+
+    pcm = np.array([[1000, 3000], [-2000, 0], [32767, -32768]], dtype=np.int16)
+    path = tmp_path / "stereo.wav"
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(16000)
+        w.writeframes(pcm.tobytes())
+
+    data = read_wav_mono_16k(str(path))
+
+    assert data.dtype == np.float32
+    assert np.allclose(data, pcm.astype(np.float32).mean(axis=1) / 32768.0)
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import importlib.util
+import sys
+
+import pytest
+
 from loquilex.mt.translator import Translator
 from loquilex.output.vtt import write_vtt
 
@@ -21,3 +26,112 @@ def test_translator_bos_handling():
     out = tr.translate("Hello world", src_lang="en", tgt_lang="zh", quality="final")
     assert isinstance(out.text, str)
     assert out.model in {"facebook/nllb-200-distilled-600M", "facebook/m2m100_418M", "echo"}
+
+
+@pytest.fixture
+def real_translator(monkeypatch):
+    """The real Translator class; conftest swaps the module attribute for the fake."""
+    import loquilex.mt.translator as mt
+
+    name = "loquilex.mt._translator_under_test"
+    spec = importlib.util.spec_from_file_location(name, mt.__file__)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, name, module)
+    spec.loader.exec_module(module)
+    return module.Translator
+
+
+class _MarkerBatch:
+    """Tensor stand-in: ``.to()`` is a no-op and the payload is the raw texts."""
+
+    def __init__(self, texts):
+        self.texts = texts
+
+    def to(self, _device):
+        return self
+
+
+class _MarkerTokenizer:
+    src_lang = "eng_Latn"
+
+    def __call__(self, texts, **_kwargs):
+        return {"input_ids": _MarkerBatch(list(texts))}
+
+    def convert_tokens_to_ids(self, _token):
+        return 0
+
+    def batch_decode(self, gen, **_kwargs):
+        return [f"<{t}>" for t in gen]
+
+
+class _MarkerModel:
+    def generate(self, input_ids, **_kwargs):
+        return list(input_ids.texts)
+
+
+def test_translator_batch_is_positional(real_translator):
+    tr = real_translator()
+    tr._load_nllb = lambda: (_MarkerTokenizer(), _MarkerModel())
+    texts = ["Hello", "world", "again"]
+
+    outs = tr.translate_batch(texts, src_lang="en", tgt_lang="zh", quality="final")
+
+    assert [o.text for o in outs] == [f"<{t}>" for t in texts]
+    assert all(o.model.endswith(":final") for o in outs)
+
+
+def test_translator_batch_falls_back_to_echo_in_order(real_translator):
+    tr = real_translator()
+
+    def unavailable():
+        raise RuntimeError("no model")
+
+    tr._load_nllb = unavailable
+    tr._load_m2m = unavailable
+
+    outs = tr.translate_batch(["Hello", "world"], src_lang="en", tgt_lang="zh", quality="final")
+
+    assert [o.model for o in outs] == ["echo", "echo"]
+    assert outs[0].text.endswith("Hello")
+    assert outs[1].text.endswith("world")
+
+
+def test_cue_appenders_match_single_appends(tmp_path):
+    from loquilex.output.srt import SrtCueAppender, append_srt_cue
+    from loquilex.output.vtt import VttCueAppender, append_vtt_cue
+
+    cues = [(0.0, 1.0, "a"), (0.5, 1.2, "b "), (1.2, 1.2, "c")]  # overlapping + zero len
+    one_vtt, buf_vtt = tmp_path / "one.vtt", tmp_path / "buf.vtt"
+    one_srt, buf_srt = tmp_path / "one.srt", tmp_path / "buf.srt"
+    vtt = VttCueAppender(str(buf_vtt))
+    srt = SrtCueAppender(str(buf_srt))
+    for a, b, t in cues:
+        append_vtt_cue(str(one_vtt), a, b, t)
+        append_srt_cue(str(one_srt), None, a, b, t)
+        vtt.add(a, b, t)
+        assert srt.add(a, b, t) == cues.index((a, b, t)) + 1
+    assert not buf_vtt.exists()  # nothing written until flush
+    vtt.flush()
+    srt.flush()
+    assert buf_vtt.read_text(encoding="utf-8") == one_vtt.read_text(encoding="utf-8")
+    assert buf_srt.read_text(encoding="utf-8") == one_srt.read_text(encoding="utf-8")
+
+    # A new appender resumes from the cues already on disk
+    srt2 = SrtCueAppender(str(buf_srt))
+    assert srt2.add(0.0, 0.5, "d") == 4
+    srt2.flush()
+    append_srt_cue(str(one_srt), None, 0.0, 0.5, "d")
+    assert buf_srt.read_text(encoding="utf-8") == one_srt.read_text(encoding="utf-8")
+
+
+def test_parse_vtt_streams_multiline_cues(tmp_path):
+    from loquilex.cli.vtt_to_zh import parse_vtt
+
+    path = tmp_path / "in.vtt"
+    path.write_text(
+        "WEBVTT\n\n1\n00:00:00.000 --> 00:00:00.500\nhello\nthere\n\n\n"
+        "2\n00:00:00,500 --> 00:00:01,250\nworld",  # comma ms, no trailing newline
+        encoding="utf-8",
+    )
+    assert parse_vtt(str(path)) == [(0.0, 0.5, "hello there"), (0.5, 1.25, "world")]